@@ -0,0 +1,147 @@
+"""
+Compare the pure ASGI JWTAuthenticationMiddleware with the previous
+BaseHTTPMiddleware implementation
+
+Measures requests per second of an authenticated endpoint in-process over
+httpx.ASGITransport, and time to first byte of a streaming endpoint through
+a local uvicorn server (ASGITransport buffers whole responses). The
+user-existence check is served from the user cache so the numbers reflect
+middleware overhead only.
+
+Usage:
+    PYTHONPATH=src:. python benchmarks/auth_middleware.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+import src.models  # noqa: E402, F401
+from src.auth.util.jwt import create_access_token  # noqa: E402
+from src.auth.util.user_cache import remember_user_locally  # noqa: E402
+from src.config.middleware import JWTAuthenticationMiddleware  # noqa: E402
+from src.config.trace_config import set_trace_id  # noqa: E402
+from src.response.error_definitions import BaseAppException  # noqa: E402
+
+USER_ID = 1
+STREAM_CHUNKS = 5
+STREAM_DELAY_SECONDS = 0.05
+
+
+class BaseHTTPJWTAuthenticationMiddleware(BaseHTTPMiddleware):
+    """
+    The previous implementation (same checks, on top of BaseHTTPMiddleware)
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        trace_id = "benchmark"
+        set_trace_id(trace_id)
+
+        if not JWTAuthenticationMiddleware.is_public(request):
+            try:
+                request.state.user_id = await JWTAuthenticationMiddleware.authenticate(
+                    request
+                )
+            except BaseAppException as exc:
+                response = await JWTAuthenticationMiddleware.error_response(
+                    request, exc, trace_id
+                )
+                response.headers["Trace-ID"] = trace_id
+                return response
+
+        response = await call_next(request)
+        response.headers["Trace-ID"] = trace_id
+        return response
+
+
+def create_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"user_id": request.state.user_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(STREAM_CHUNKS):
+                yield f"{index}\n"
+                await asyncio.sleep(STREAM_DELAY_SECONDS)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+async def measure_rps(app: FastAPI, headers: dict, requests: int, concurrency: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ping():
+            async with semaphore:
+                response = await client.get("/ping", headers=headers)
+                response.raise_for_status()
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(ping() for _ in range(requests)))
+        return requests / (time.perf_counter() - started_at)
+
+
+async def measure_ttfb(app: FastAPI, headers: dict) -> float:
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            started_at = time.perf_counter()
+            async with client.stream("GET", "/stream", headers=headers) as response:
+                async for _ in response.aiter_raw():
+                    return time.perf_counter() - started_at
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Auth middleware benchmark")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    remember_user_locally(USER_ID)
+    headers = {"Authorization": f"Bearer {create_access_token(USER_ID)}"}
+
+    for name, middleware in [
+        ("BaseHTTPMiddleware", BaseHTTPJWTAuthenticationMiddleware),
+        ("Pure ASGI", JWTAuthenticationMiddleware),
+    ]:
+        app = create_app(middleware)
+        rps = await measure_rps(app, headers, args.requests, args.concurrency)
+        ttfb = await measure_ttfb(app, headers)
+        print(f"{name:<20} {rps:>8.0f} req/s   stream TTFB {ttfb * 1000:>6.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
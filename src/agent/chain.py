@@ -14,6 +14,8 @@ from src.agent.schemas import (
     RecommendAssigneeListRes,
     RecommendAssigneeRes,
 )
+from src.common.util.executor import run_blocking
+from src.common.util.github_rate_limit import GitHubPriority, set_github_priority
 from src.issue import repository as issue_repository
 from src.issue_rescheduling import repository as issue_rescheduling_repository
 from src.project import repository as project_repository
@@ -42,7 +44,7 @@ class CustomAgentExecutor:
         print("--------------------------------------------")
 
         # Get project information   
-        project = project_repository.find_project_by_id(db, project_id)
+        project = await run_blocking(project_repository.find_project_by_id, db, project_id)
         if not project:
             raise ProjectNotFound()
         
@@ -55,7 +57,7 @@ class CustomAgentExecutor:
         }
         
         project_dir = os.path.join("design_docs", project.name)
-        file_names = os.listdir(project_dir)
+        file_names = await run_blocking(os.listdir, project_dir)
         if not file_names:
             raise DesignDocNotFound()
         
@@ -92,18 +94,20 @@ class CustomAgentExecutor:
         print("Starting competency assessment...")
 
         # get user
-        user = user_repository.find_user_by_user_id(db, user_id)
+        user = await run_blocking(user_repository.find_user_by_user_id, db, user_id)
         if not user:
             raise UserNotFound()
         
-        selected_repo_names = user_repository_service.get_all_selected_repositories(user_id, db)
-        activity_info = await tool.get_github_activation_info(selected_repo_names, user.github_access_token)
+        selected_repo_names = await run_blocking(user_repository_service.get_all_selected_repositories, user_id, db)
+        # Bulk collection yields GitHub budget to interactive requests
+        set_github_priority(GitHubPriority.BACKGROUND)
+        activity_info = await tool.get_github_activation_info(selected_repo_names, user.github_access_token, user_id, db)
         if not activity_info:
             raise GitHubActivationInfoError()
         
         stat = await tool.assess_with_data(user, activity_info)
         user.stat = stat
-        user_repository.update_user_stat(db, user)
+        await run_blocking(user_repository.update_user_stat, db, user)
 
         print("--------------------------------------------")
         print("Competency assessment completed.")
@@ -122,14 +126,14 @@ class CustomAgentExecutor:
         print("--------------------------------------------")
 
         # Get project information from database
-        project = project_repository.find_project_by_id(db, project_id)
+        project = await run_blocking(project_repository.find_project_by_id, db, project_id)
         if not project:
             raise ProjectNotFound()
 
         # Get user stats
         user_stat_list = list()
         for projectUser in project.members:
-            user = user_repository.find_user_by_user_id(db, projectUser.user_id)
+            user = await run_blocking(user_repository.find_user_by_user_id, db, projectUser.user_id)
             if not user:
                 raise UserNotFound()
             user_stat_list.append(user.stat)
@@ -162,12 +166,12 @@ class CustomAgentExecutor:
         print("--------------------------------------------")
 
         # Get project information from database
-        project = project_repository.find_project_by_id(db, project_id)
+        project = await run_blocking(project_repository.find_project_by_id, db, project_id)
         if not project:
             raise ProjectNotFound()
 
         # Get issue rescheduling information from database
-        issue_rescheduling = issue_rescheduling_repository.find_issue_scheduling_by_id(db, issue_rescheduling_id)
+        issue_rescheduling = await run_blocking(issue_rescheduling_repository.find_issue_scheduling_by_id, db, issue_rescheduling_id)
         if not issue_rescheduling:
             raise IssueReschedulingNotFound()
         
@@ -175,13 +179,13 @@ class CustomAgentExecutor:
         members = project.members
         user_stat_list = list()
         for member in members:
-            user = user_repository.find_user_by_user_id(db, member.user_id)
+            user = await run_blocking(user_repository.find_user_by_user_id, db, member.user_id)
             if not user:
                 raise UserNotFound()
             user_stat_list.append(user.stat)
 
         # Get issue information from database
-        issue = issue_repository.find_issue_by_issue_number(
+        issue = await issue_repository.find_issue_by_issue_number(
             project.owner, project.repo_fullname, issue_rescheduling.issue_number, db
         )
         if not issue:
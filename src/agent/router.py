@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from src.agent import chain
+from src.agent.runtime import get_agent_chain
 from src.agent.schemas import (
     AssessStatRes,
     FeedbackReq,
@@ -31,6 +31,7 @@ async def generate_issues(project_id: int, db: Session = Depends(get_db)):
     Generate issues using the agent executor.
     """
     try:
+        chain = await get_agent_chain()
         executor = chain.CustomAgentExecutor()
         return StreamingResponse(
             executor.generate_issues(project_id, db),
@@ -50,6 +51,7 @@ async def assess_stat(
     """
     Assess the competency of a user based on their GitHub activity.
     """
+    chain = await get_agent_chain()
     executor = chain.CustomAgentExecutor()
     result = await executor.assess_competency(
         request.state.user_id, db
@@ -69,6 +71,7 @@ async def recommend_assignees(
     """
     Recommend assignees for issues based on their competency.
     """
+    chain = await get_agent_chain()
     executor = chain.CustomAgentExecutor()
     result = await executor.recommend_assignees_for_issues(
         db, project_id, recommendAssigneeReq.issues
@@ -86,6 +89,7 @@ async def get_feedback(feedbackReq: FeedbackReq, db: Session = Depends(get_db)):
     """
     Get feedback for issue rescheduling.
     """
+    chain = await get_agent_chain()
     executor = chain.CustomAgentExecutor()
     result = await executor.get_feedback(feedbackReq.project_id, feedbackReq.issue_rescheduling_id, db)
 
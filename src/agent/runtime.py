@@ -0,0 +1,145 @@
+import asyncio
+import importlib
+import os
+import sys
+import threading
+
+from src.common.util.executor import run_blocking
+from src.config.config import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+    GOOGLE_APPLICATION_CREDENTIALS,
+    VERTEX_EMBEDDING_MODEL,
+    VERTEX_PROJECT_ID,
+)
+from src.config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# langchain, vertexai, chromadb and pdfplumber are only imported by the agent
+# chain, so workers load them on the first agent request (or the warm-up)
+AGENT_CHAIN_MODULE = "src.agent.chain"
+
+runtime_lock = threading.RLock()
+embedding = None
+vector_db = None
+llm = None
+decomposition_chain = None
+warm_up_task: asyncio.Task | None = None
+
+
+def get_embedding():
+    """
+    Returns the Vertex AI embeddings, creating them on first use
+    """
+    global embedding
+    with runtime_lock:
+        if embedding is None:
+            from langchain_google_vertexai import VertexAIEmbeddings
+
+            if GOOGLE_APPLICATION_CREDENTIALS:
+                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
+            embedding = VertexAIEmbeddings(
+                model_name=VERTEX_EMBEDDING_MODEL, project=VERTEX_PROJECT_ID
+            )
+    return embedding
+
+
+def get_vector_db():
+    """
+    Returns the persistent Chroma store, opening it on first use
+    """
+    global vector_db
+    with runtime_lock:
+        if vector_db is None:
+            from langchain_chroma import Chroma
+
+            vector_db = Chroma(
+                persist_directory="chroma_db", embedding_function=get_embedding()
+            )
+    return vector_db
+
+
+def get_llm():
+    """
+    Returns the Gemini chat model, creating it on first use
+    """
+    global llm
+    with runtime_lock:
+        if llm is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            llm = ChatGoogleGenerativeAI(
+                model=GEMINI_MODEL, temperature=0, google_api_key=GEMINI_API_KEY
+            )
+    return llm
+
+
+def get_decomposition_chain():
+    global decomposition_chain
+    with runtime_lock:
+        if decomposition_chain is None:
+            from src.agent import prompts
+
+            decomposition_chain = get_llm() | prompts.decomposition_prompt_template
+    return decomposition_chain
+
+
+async def aget_llm():
+    """
+    get_llm without blocking the event loop on the first call
+    """
+    if llm is not None:
+        return llm
+    return await run_blocking(get_llm)
+
+
+async def aget_decomposition_chain():
+    if decomposition_chain is not None:
+        return decomposition_chain
+    return await run_blocking(get_decomposition_chain)
+
+
+async def get_agent_chain():
+    """
+    Returns the agent chain module, importing it in the blocking pool on first
+    use
+    """
+    chain = sys.modules.get(AGENT_CHAIN_MODULE)
+    if chain is not None:
+        return chain
+    return await run_blocking(importlib.import_module, AGENT_CHAIN_MODULE)
+
+
+async def warm_up_agent_runtime():
+    """
+    Import the agent stack and create the LLM ahead of the first request
+
+    The vector store is left out, no endpoint uses it yet.
+    """
+    try:
+        await get_agent_chain()
+        await aget_decomposition_chain()
+        logger.info("✅ Agent runtime warmed up")
+    except Exception as e:
+        # The first agent request retries and reports the error
+        logger.warning(f"Agent runtime warm-up failed: {e}")
+
+
+def start_agent_warm_up():
+    """
+    Warm up the agent runtime in the background (called on server startup)
+    """
+    global warm_up_task
+    if warm_up_task is None:
+        warm_up_task = asyncio.get_running_loop().create_task(warm_up_agent_runtime())
+
+
+def stop_agent_warm_up():
+    """
+    Stop a warm-up that is still running (called on server shutdown)
+    """
+    global warm_up_task
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        warm_up_task = None
@@ -1,27 +1,18 @@
+import asyncio
 import json
-import os
 import re
 import tempfile
 from pathlib import Path
 
-import pdfplumber
-from docx import Document
 from fastapi import File, UploadFile
 from langchain.schema import HumanMessage, SystemMessage
-from langchain_chroma import Chroma
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_google_vertexai import VertexAIEmbeddings
+from sqlalchemy.orm import Session
 
 from src.agent import prompts
+from src.agent.runtime import aget_decomposition_chain, aget_llm, get_vector_db
 from src.agent.schemas import GenerateIssueListRes
 from src.auth import service as auth_service
-from src.config.config import (
-    GEMINI_API_KEY,
-    GEMINI_MODEL,
-    GOOGLE_APPLICATION_CREDENTIALS,
-    VERTEX_EMBEDDING_MODEL,
-    VERTEX_PROJECT_ID,
-)
+from src.common.util.executor import run_blocking
 from src.issue.schemas import IssueRes
 from src.models import IssueRescheduling, Project, User
 from src.response.error_definitions import (
@@ -31,39 +22,28 @@ from src.response.error_definitions import (
     RepositoryNotFoundInGitHub,
 )
 from src.stat import service as stat_service
-
-os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
-
-embedding = VertexAIEmbeddings(model_name=VERTEX_EMBEDDING_MODEL, project=VERTEX_PROJECT_ID)
-vector_db = Chroma(persist_directory="chroma_db", embedding_function=embedding)
-llm = ChatGoogleGenerativeAI(
-    model=GEMINI_MODEL,
-    temperature=0,
-    google_api_key=GEMINI_API_KEY
-)
-
-decomposition_chain = llm | prompts.decomposition_prompt_template
+from src.user_activity import service as user_activity_service
 
 
 def add_text_data_tool(texts: list, metadatas: list):
     """
     Add data to the vector database.
     """
-    vector_db.add_texts(texts, metadatas=metadatas)
+    get_vector_db().add_texts(texts, metadatas=metadatas)
 
 
 def add_image_data_tool(images: list, metadatas: list):
     """
     Add image data to the vector database.
     """
-    vector_db.add_images(images, metadatas=metadatas)
+    get_vector_db().add_images(images, metadatas=metadatas)
 
 
 def search_data_tool(query: str, k: int = 2) -> list:
     """
     Search for similar data in the vector database.
     """
-    results = vector_db.similarity_search(query, k=k)
+    results = get_vector_db().similarity_search(query, k=k)
     return results
 
 
@@ -71,7 +51,8 @@ async def decompose_task_tool(prompt: str) -> list:
     """
     Decomposes the input prompt into actionable steps.
     """
-    steps_str = str(decomposition_chain.invoke(prompt))
+    decomposition_chain = await aget_decomposition_chain()
+    steps_str = str(await decomposition_chain.ainvoke(prompt))
 
     steps_list = [line.strip() for line in steps_str.split("\n") if line.strip()]
     return steps_list
@@ -98,6 +79,7 @@ async def communicate_with_llm_tool(prompt: str) -> str:
         SystemMessage(content="You are a professional project manager"),
         HumanMessage(content=prompt)
     ]
+    llm = await aget_llm()
     response = await llm.agenerate([message])
     
     return response.generations[0][0].text
@@ -161,6 +143,8 @@ async def make_issues(project_info: dict, design_documents: str, features: dict)
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
+    import pdfplumber
+
     text = ""
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -169,6 +153,8 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
 
 
 def extract_text_from_docx(docx_path: Path) -> str:
+    from docx import Document
+
     doc = Document(docx_path)
     text = ""
     for paragraph in doc.paragraphs:
@@ -190,11 +176,11 @@ async def extract_text_from_documents(file: UploadFile = File(...)):
         tmp_path = Path(tmp.name)
 
     if suffix == ".pdf":
-        text = extract_text_from_pdf(tmp_path)
+        text = await run_blocking(extract_text_from_pdf, tmp_path)
     elif suffix == ".docx":
-        text = extract_text_from_docx(tmp_path)
+        text = await run_blocking(extract_text_from_docx, tmp_path)
     elif suffix == ".json":
-        text = extract_text_from_json(tmp_path)
+        text = await run_blocking(extract_text_from_json, tmp_path)
     else:
         raise InvalidFileType()
         # TODO: Handle other file types if needed
@@ -218,14 +204,15 @@ def extract_json_dict_from_response(response_text: str) -> dict:
         raise ParseJsonFromResponseError()
 
 
-async def get_github_activation_info(selected_repo_names: list[str],token: str):
+async def get_github_activation_info(selected_repo_names: list[str],token: str, user_id: int, db: Session):
     """
     Get GitHub information using the agent executor.
     """
-    repo_list = stat_service.get_repositories(token)
-
-    # get user name from token
-    user_info = await auth_service.get_github_user_info(token)
+    # get repositories and user name from token
+    repo_list, user_info = await asyncio.gather(
+        stat_service.get_repositories(token),
+        auth_service.get_github_user_info(token),
+    )
     user_name = user_info["login"]
 
     repo_names_from_github = [repo["name"] for repo in repo_list]
@@ -235,13 +222,20 @@ async def get_github_activation_info(selected_repo_names: list[str],token: str):
     
     selected_repo_list = [repo for repo in repo_list if repo["name"] in [repo.repo_fullname for repo in selected_repo_names]]
 
+    activities = await user_activity_service.collect_user_activities(
+        user_id, [repo["name"] for repo in selected_repo_list], user_name, token, db
+    )
+
+    # Repositories that failed are skipped (partial result)
+    activation_info = []
     for selected_repo in selected_repo_list:
-        prs = stat_service.get_pull_requests(selected_repo["name"], user_name, token)
-        commits = stat_service.get_commits(selected_repo["name"], user_name, token)
-        selected_repo["prs"] = prs
-        selected_repo["commits"] = commits
+        activity = activities.get(selected_repo["name"])
+        if activity:
+            selected_repo["prs"] = activity["prs"]
+            selected_repo["commits"] = activity["commits"]
+            activation_info.append(selected_repo)
 
-    return selected_repo_list
+    return activation_info
 
 
 async def assess_with_data(user: User, github_activation_data: list):
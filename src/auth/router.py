@@ -8,6 +8,7 @@ from auth import service
 from auth.schemas import AuthReq, AuthRes, RefreshReq
 from src.config.config import GITHUB_CLIENT_ID, GITHUB_REDIRECT_URI
 from src.config.database import get_db
+from src.config.route_policy import RoutePolicy, register_route_policy
 from src.response.schemas import SuccessResponse
 from src.response.success_definitions import (
     login_success,
@@ -22,6 +23,10 @@ GITHUB_OAUTH_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
 
 router = APIRouter(prefix="/auth", tags=["GitHub OAuth"])
 
+# Logout and user update need the access token
+for path in ["/github/login", "/github/callback", "/login", "/register", "/refresh"]:
+    register_route_policy(f"{router.prefix}{path}", RoutePolicy.PUBLIC)
+
 
 @router.get("/github/login", summary="Redirect to GitHub login page")
 def login_with_github():
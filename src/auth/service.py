@@ -8,8 +8,14 @@ from auth.schemas import AuthReq, AuthRes
 from auth.util.github import get_github_access_token, get_github_user_info
 from auth.util.jwt import create_access_token, create_refresh_token, parse_token
 from auth.util.redis import (
+    GITHUB_OAUTH_REDIS,
+    REFRESH_TOKEN_REDIS,
     delete_token_from_redis,
+    exchange_token_in_redis,
+    get_access_token_ttl,
+    get_refresh_token_ttl,
     get_token_from_redis,
+    rotate_token_in_redis,
     save_token_to_redis,
 )
 from src.config.config import ACCESS_TOKEN_EXPIRE_MINUTES, FRONTEND_URL, IS_LOCAL
@@ -25,9 +31,6 @@ from src.user import repository as user_repository
 from src.user import service as user_service
 from src.user.schemas import UserReq, UserRes
 
-GITHUB_OAUTH_REDIS = "github_oauth"
-REFRESH_TOKEN_REDIS = "refresh_token"
-
 
 async def github_callback(
     request: Request,
@@ -83,8 +86,10 @@ async def github_callback(
         """
         Redirect to Register Page
         """
-        # Save GitHub AccessToken in redis temporary
-        await save_token_to_redis(GITHUB_OAUTH_REDIS, github_id, github_access_token)
+        # Save GitHub AccessToken in redis temporary (until the access token expires)
+        await save_token_to_redis(
+            GITHUB_OAUTH_REDIS, github_id, github_access_token, get_access_token_ttl()
+        )
         access_token = create_access_token(github_id)
 
         redirect = RedirectResponse(url=f"{FRONTEND_URL}/register/{github_name}")
@@ -141,14 +146,18 @@ async def register(
     saved_user = await user_service.create_user(db, new_user)
     user_res = UserRes.model_validate(saved_user)
 
-    # Delete github access token stored in redis
-    await delete_token_from_redis(github_access_token)
-
     access_token = create_access_token(saved_user.id)
     refresh_token = create_refresh_token(saved_user.id)
 
-    # Save refresh token in redis
-    await save_token_to_redis(REFRESH_TOKEN_REDIS, saved_user.id, refresh_token)
+    # Delete github access token and save refresh token in redis
+    await exchange_token_in_redis(
+        GITHUB_OAUTH_REDIS,
+        github_id,
+        REFRESH_TOKEN_REDIS,
+        saved_user.id,
+        refresh_token,
+        get_refresh_token_ttl(),
+    )
 
     return AuthRes(
         user=user_res, access_token=access_token, refresh_token=refresh_token
@@ -165,7 +174,6 @@ async def login(db: Session, access_token: Optional[str] = Cookie(None)):
         raise AccessTokenNotFound()
 
     github_id = parse_token(access_token)
-    github_access_token = await get_token_from_redis(GITHUB_OAUTH_REDIS, github_id)
 
     existing_user = user_repository.find_user_by_github_id(db, github_id)
     if not existing_user:
@@ -174,14 +182,18 @@ async def login(db: Session, access_token: Optional[str] = Cookie(None)):
     # Update github info
     user_service.update_github_user(db, github_id)
 
-    # Delete github access token stored in redis
-    await delete_token_from_redis(github_access_token)
-
     access_token = create_access_token(existing_user.id)
     refresh_token = create_refresh_token(existing_user.id)
 
-    # Save refresh token in redis
-    await save_token_to_redis(REFRESH_TOKEN_REDIS, existing_user.id, refresh_token)
+    # Delete github access token and save refresh token in redis
+    await exchange_token_in_redis(
+        GITHUB_OAUTH_REDIS,
+        github_id,
+        REFRESH_TOKEN_REDIS,
+        existing_user.id,
+        refresh_token,
+        get_refresh_token_ttl(),
+    )
 
     user_res = UserRes.model_validate(existing_user)
 
@@ -196,27 +208,30 @@ async def refresh(db: Session, refresh_token: str):
 
     Validate existing refresh token and reissue new tokens
     """
-    # redis compoare for validation
     user_id = parse_token(refresh_token)
-    redis_refresh_token = await get_token_from_redis(REFRESH_TOKEN_REDIS, user_id)
-
-    if refresh_token != redis_refresh_token:
-        raise InvalidRefreshToken()
 
     user = user_repository.find_user_by_user_id(db, user_id)
     if not user:
         raise UserNotFound()
 
-    # Delete existing refresh token stored in redis
-    await delete_token_from_redis(refresh_token)
-
     access_token = create_access_token(user.id)
-    refresh_token = create_refresh_token(user.id)
-
-    # Save refresh token in redis
-    await save_token_to_redis(REFRESH_TOKEN_REDIS, user.id, refresh_token)
+    new_refresh_token = create_refresh_token(user.id)
+
+    # Swap the refresh token only if redis still holds the presented one, so a
+    # refresh token can be used once
+    rotated = await rotate_token_in_redis(
+        REFRESH_TOKEN_REDIS,
+        user.id,
+        refresh_token,
+        new_refresh_token,
+        get_refresh_token_ttl(),
+    )
+    if not rotated:
+        raise InvalidRefreshToken()
 
-    return AuthRes(user=user, access_token=access_token, refresh_token=refresh_token)
+    return AuthRes(
+        user=user, access_token=access_token, refresh_token=new_refresh_token
+    )
 
 
 async def update(user_id: int, auth_req: AuthReq, db: Session):
@@ -251,5 +266,4 @@ async def logout(user_id: int):
     Deleting refresh token stored in redis
     """
     # Delete existing refresh token stored in redis
-    redis_refresh_token = await get_token_from_redis(REFRESH_TOKEN_REDIS, user_id)
-    await delete_token_from_redis(redis_refresh_token)
+    await delete_token_from_redis(REFRESH_TOKEN_REDIS, user_id)
@@ -1,40 +1,71 @@
-import httpx
+import hashlib
 
+from src.common.util.github_client import get_github_client, github_request
+from src.common.util.lru_cache import LRUCache
 from src.config.config import (
     GITHUB_CLIENT_ID,
     GITHUB_CLIENT_SECRET,
+    GITHUB_PROFILE_CACHE_MAX_ENTRIES,
+    GITHUB_PROFILE_CACHE_TTL_SECONDS,
     GITHUB_REDIRECT_URI,
 )
+from src.config.logger_config import setup_logger
 
 GITHUB_OAUTH_ACCESS_TOKEN_URL = "https://github.com/login/oauth/access_token"
-GITHUB_API_USER_URL = "https://api.github.com/user"
+GITHUB_API_USER_URL = "/user"
+
+logger = setup_logger(__name__)
+
+# sha256(access token) -> profile
+github_profiles: LRUCache[bytes, dict] = LRUCache(
+    GITHUB_PROFILE_CACHE_MAX_ENTRIES, GITHUB_PROFILE_CACHE_TTL_SECONDS
+)
 
 
 async def get_github_access_token(code: str) -> str | None:
     """
     Get GitHub AccessToken
     """
-    async with httpx.AsyncClient() as client:
-        headers = {"Accept": "application/json"}
-        data = {
-            "client_id": GITHUB_CLIENT_ID,
-            "client_secret": GITHUB_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": GITHUB_REDIRECT_URI,
-        }
+    headers = {"Accept": "application/json"}
+    data = {
+        "client_id": GITHUB_CLIENT_ID,
+        "client_secret": GITHUB_CLIENT_SECRET,
+        "code": code,
+        "redirect_uri": GITHUB_REDIRECT_URI,
+    }
+
+    # The shared client keeps its github.com connections alive next to the API ones
+    res = await get_github_client().post(
+        GITHUB_OAUTH_ACCESS_TOKEN_URL, headers=headers, data=data
+    )
+    return res.json().get("access_token")
 
-        res = await client.post(
-            GITHUB_OAUTH_ACCESS_TOKEN_URL, headers=headers, data=data
-        )
-        return res.json().get("access_token")
+
+def get_cached_github_profile(digest: bytes) -> dict | None:
+    return github_profiles.get(digest)
+
+
+def save_cached_github_profile(digest: bytes, profile: dict):
+    github_profiles.set(digest, profile)
 
 
 async def get_github_user_info(access_token: str) -> dict:
     """
     Get GitHub User Info
+
+    Profiles are cached per token for GITHUB_PROFILE_CACHE_TTL_SECONDS, so the
+    callback -> register flow reads /user once
     """
-    async with httpx.AsyncClient() as client:
-        headers = {"Authorization": f"Bearer {access_token}"}
+    digest = hashlib.sha256(access_token.encode()).digest()
+    profile = get_cached_github_profile(digest)
+    if profile is not None:
+        return profile
 
-        res = await client.get(GITHUB_API_USER_URL, headers=headers)
-        return res.json()
+    headers = {"Authorization": f"Bearer {access_token}"}
+    res = await github_request("GET", GITHUB_API_USER_URL, headers=headers)
+    profile = res.json()
+    if res.status_code == 200:
+        save_cached_github_profile(digest, profile)
+    else:
+        logger.warning(f"GitHub user info request failed: {res.status_code}")
+    return profile
@@ -1,12 +1,16 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 
+from src.common.util.lru_cache import LRUCache
 from src.config.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
+    JWT_CACHE_MAX_ENTRIES,
     JWT_SECRET,
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
@@ -14,6 +18,10 @@ from src.response.error_definitions import ExpiredJwtToken, InvalidJwtToken
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# sha256(token) -> sub of tokens whose signature was already verified, expiring
+# at the token's exp
+verified_tokens: LRUCache[bytes, str] = LRUCache(JWT_CACHE_MAX_ENTRIES, clock=time.time)
+
 
 def create_token(data: dict, timedelta: timedelta):
     """
@@ -43,10 +51,29 @@ def create_refresh_token(id: int) -> str:
     )
 
 
+def get_verified_token(digest: bytes) -> Optional[str]:
+    """
+    Returns the sub of an already verified token, None once it is expired
+    """
+    return verified_tokens.get(digest)
+
+
+def remember_verified_token(digest: bytes, user_id: str, exp: float):
+    verified_tokens.set(digest, user_id, expires_at=exp)
+
+
 def parse_token(token: str) -> Optional[dict]:
     """
     Verify access token
+
+    Verified tokens are cached until their exp, so a reused token skips the
+    signature check
     """
+    digest = hashlib.sha256(token.encode()).digest()
+    user_id = get_verified_token(digest)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
         if payload is None:
@@ -54,8 +81,13 @@ def parse_token(token: str) -> Optional[dict]:
         user_id = payload.get("sub")
         if user_id is None:
             raise InvalidJwtToken("토큰에서 사용자 정보를 찾을 수 없습니다.")
-        return user_id
     except jwt.ExpiredSignatureError:
         raise ExpiredJwtToken()
     except jwt.JWTError as e:
         raise InvalidJwtToken(reason=str(e))
+
+    # Tokens without exp are verified every time
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remember_verified_token(digest, user_id, exp)
+    return user_id
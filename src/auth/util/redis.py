@@ -2,20 +2,56 @@ import redis.asyncio as redis
 
 from src.config import config
 
-redis_client = redis.Redis(
+GITHUB_OAUTH_REDIS = "github_oauth"
+REFRESH_TOKEN_REDIS = "refresh_token"
+
+# Requests wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection instead
+# of opening connections without limit
+redis_pool = redis.BlockingConnectionPool(
     host=config.REDIS_HOST,
     port=config.REDIS_PORT,
     db=0,
     password=config.REDIS_PASSWORD,
     decode_responses=True,
+    max_connections=config.REDIS_MAX_CONNECTIONS,
+    timeout=config.REDIS_POOL_TIMEOUT_SECONDS,
+    socket_timeout=config.REDIS_SOCKET_TIMEOUT_SECONDS,
+    health_check_interval=30,
 )
 
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Replace the stored token only if it is still the presented one
+ROTATE_TOKEN_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+  return 1
+end
+return 0
+"""
+
+rotate_token_script = redis_client.register_script(ROTATE_TOKEN_SCRIPT)
 
-async def save_token_to_redis(token_type: str, id: int, token: str):
+
+def get_access_token_ttl() -> int:
     """
-    Save Token in Redis
+    Returns the lifetime of an access token in seconds
     """
-    await redis_client.set(f"{token_type}:{id}", token)
+    return int(config.ACCESS_TOKEN_EXPIRE_MINUTES) * 60
+
+
+def get_refresh_token_ttl() -> int:
+    """
+    Returns the lifetime of a refresh token in seconds
+    """
+    return int(config.REFRESH_TOKEN_EXPIRE_DAYS) * 24 * 60 * 60
+
+
+async def save_token_to_redis(token_type: str, id: int, token: str, ttl: int):
+    """
+    Save Token in Redis, expiring after ttl seconds
+    """
+    await redis_client.set(f"{token_type}:{id}", token, ex=ttl)
 
 
 async def get_token_from_redis(token_type: str, id: int):
@@ -25,8 +61,35 @@ async def get_token_from_redis(token_type: str, id: int):
     return await redis_client.get(f"{token_type}:{id}")
 
 
-async def delete_token_from_redis(token: str):
+async def delete_token_from_redis(token_type: str, id: int):
     """
     Delete Token from Redis
     """
-    return await redis_client.delete(token)
+    return await redis_client.delete(f"{token_type}:{id}")
+
+
+async def exchange_token_in_redis(
+    delete_type: str, delete_id: int, token_type: str, id: int, token: str, ttl: int
+):
+    """
+    Delete a token and save another one in a single round trip (MULTI/EXEC)
+    """
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(f"{delete_type}:{delete_id}")
+        pipe.set(f"{token_type}:{id}", token, ex=ttl)
+        await pipe.execute()
+
+
+async def rotate_token_in_redis(
+    token_type: str, id: int, old_token: str, new_token: str, ttl: int
+) -> bool:
+    """
+    Atomically replace old_token with new_token
+
+    Returns False when the stored token is not old_token (already rotated,
+    logged out or expired)
+    """
+    rotated = await rotate_token_script(
+        keys=[f"{token_type}:{id}"], args=[old_token, new_token, ttl]
+    )
+    return rotated == 1
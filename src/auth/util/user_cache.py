@@ -0,0 +1,85 @@
+from redis.exceptions import RedisError
+
+from src.auth.util.redis import redis_client
+from src.common.util.lru_cache import LRUCache
+from src.config.config import (
+    USER_CACHE_BACKEND,
+    USER_CACHE_MAX_ENTRIES,
+    USER_CACHE_TTL_SECONDS,
+)
+from src.config.logger_config import setup_logger
+
+USER_CACHE_REDIS = "valid_user"
+
+logger = setup_logger(__name__)
+
+# user_id -> True
+known_users: LRUCache[int, bool] = LRUCache(
+    USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS
+)
+
+
+def is_known_user_locally(user_id: int) -> bool:
+    return known_users.get(user_id) is not None
+
+
+def remember_user_locally(user_id: int):
+    known_users.set(user_id, True)
+
+
+def forget_user_locally(user_id: int):
+    """
+    Drop the user from this worker's cache
+    """
+    known_users.pop(user_id)
+
+
+async def is_known_user(user_id: int) -> bool:
+    """
+    Check if the user was recently confirmed to exist
+    """
+    if is_known_user_locally(user_id):
+        return True
+    if USER_CACHE_BACKEND != "redis":
+        return False
+
+    try:
+        if await redis_client.exists(f"{USER_CACHE_REDIS}:{user_id}"):
+            remember_user_locally(user_id)
+            return True
+    except RedisError as e:
+        logger.warning(f"User cache read from redis failed: {e}")
+    return False
+
+
+async def remember_user(user_id: int):
+    """
+    Remember that the user exists for USER_CACHE_TTL_SECONDS
+    """
+    remember_user_locally(user_id)
+    if USER_CACHE_BACKEND != "redis":
+        return
+
+    try:
+        await redis_client.set(
+            f"{USER_CACHE_REDIS}:{user_id}", 1, ex=USER_CACHE_TTL_SECONDS
+        )
+    except RedisError as e:
+        logger.warning(f"User cache write to redis failed: {e}")
+
+
+async def forget_user(user_id: int):
+    """
+    Drop the user from the cache (called when the user is deleted)
+
+    With the memory backend other workers forget the user after
+    USER_CACHE_TTL_SECONDS at the latest
+    """
+    forget_user_locally(user_id)
+    if USER_CACHE_BACKEND != "redis":
+        return
+
+    try:
+        await redis_client.delete(f"{USER_CACHE_REDIS}:{user_id}")
+    except RedisError as e:
+        logger.warning(f"User cache delete from redis failed: {e}")
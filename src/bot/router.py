@@ -1,14 +1,19 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, Header
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.bot.util import send_daily_request
+from src.common.util.executor import run_blocking
+from src.config.async_database import get_async_db
 from src.config.database import get_db
+from src.config.route_policy import RoutePolicy, register_route_policy
 from src.issue import service as issue_service
 from src.issue.schemas import IssueRes
 from src.issue_rescheduling import service as issue_rescheduling_service
 from src.issue_rescheduling.schemas import IssueReschedulingReq, IssueReschedulingRes
+from src.models import Project, User
 from src.project import repository as project_repository
 from src.project import service as project_service
 from src.project.schemas import ProjectRes
@@ -23,27 +28,48 @@ from src.user import repository as user_repository
 
 router = APIRouter(prefix="/bot", tags=["Bot"])
 
+register_route_policy(router.prefix, RoutePolicy.BOT)
+register_route_policy(f"{router.prefix}/test-scheduler", RoutePolicy.PUBLIC)
+
+
+def find_user(discord_user_id: str, db: Session) -> User:
+    user = user_repository.find_user_by_discord_id(db, discord_user_id)
+    if not user:
+        raise UserNotFound()
+    return user
+
+
+def find_user_and_project(
+    discord_user_id: str, discord_channel_id: str, db: Session
+) -> tuple[User, Project]:
+    """
+    Returns the requesting user and the project of the channel (blocking)
+    """
+    user = find_user(discord_user_id, db)
+    project = project_repository.find_project_by_discord_channel_id(
+        db, discord_channel_id
+    )
+    if not project:
+        raise ProjectNotFound()
+    return user, project
+
 
 @router.get(
     "/project",
     summary="Get existing project",
     response_model=SuccessResponse[ProjectRes],
 )
-def get_project(
+async def get_project(
     discord_channel_id: str = Header(..., description="Discord Channel ID"),
     discord_user_id: str = Header(..., description="Discord User ID"),
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
-    user = user_repository.find_user_by_discord_id(db, discord_user_id)
-    if not user:
-        raise UserNotFound()
-    project = project_repository.find_project_by_discord_channel_id(
-        db, discord_channel_id
+    user, project = await run_blocking(
+        find_user_and_project, discord_user_id, discord_channel_id, db
     )
-    if not project:
-        raise ProjectNotFound()
 
-    data = project_service.get_project(user.id, project.id, db)
+    data = await project_service.get_project(user.id, project.id, db, async_db)
     return project_read_success(data)
 
 
@@ -52,21 +78,17 @@ def get_project(
     summary="Get all existing issues in project",
     response_model=SuccessResponse[List[IssueRes]],
 )
-def get_all_issues(
+async def get_all_issues(
     discord_channel_id: str = Header(..., description="Discord Channel ID"),
     discord_user_id: str = Header(..., description="Discord User ID"),
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
-    user = user_repository.find_user_by_discord_id(db, discord_user_id)
-    if not user:
-        raise UserNotFound()
-    project = project_repository.find_project_by_discord_channel_id(
-        db, discord_channel_id
+    user, project = await run_blocking(
+        find_user_and_project, discord_user_id, discord_channel_id, db
     )
-    if not project:
-        raise ProjectNotFound()
 
-    data = issue_service.get_all_issues(user.id, project.id, db)
+    data = await issue_service.get_all_issues(user.id, project.id, db, async_db)
     return issue_read_success(data)
 
 
@@ -75,20 +97,23 @@ def get_all_issues(
     summary="Get all existing issues for user",
     response_model=SuccessResponse[List[IssueRes]],
 )
-def get_all_issues(
+async def get_all_issues(
     discord_user_id: str = Header(..., description="Discord User ID"),
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
-    user = user_repository.find_user_by_discord_id(db, discord_user_id)
-    if not user:
-        raise UserNotFound()
+    user = await run_blocking(find_user, discord_user_id, db)
 
-    project_list = project_repository.find_projects_by_member(db, user.id)
+    project_list = await run_blocking(
+        project_repository.find_projects_by_member, db, user.id
+    )
 
     data = []
 
     for project in project_list:
-        issue_data = issue_service.get_all_issues(user.id, project.id, db)
+        issue_data = await issue_service.get_all_issues(
+            user.id, project.id, db, async_db
+        )
         data.extend(issue_data)
 
     return issue_read_success(data)
@@ -99,22 +124,20 @@ def get_all_issues(
     summary="Get existing issue",
     response_model=SuccessResponse[IssueRes],
 )
-def get_issue(
+async def get_issue(
     issue_number: int,
     discord_channel_id: str = Header(..., description="Discord Channel ID"),
     discord_user_id: str = Header(..., description="Discord User ID"),
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
-    user = user_repository.find_user_by_discord_id(db, discord_user_id)
-    if not user:
-        raise UserNotFound()
-    project = project_repository.find_project_by_discord_channel_id(
-        db, discord_channel_id
+    user, project = await run_blocking(
+        find_user_and_project, discord_user_id, discord_channel_id, db
     )
-    if not project:
-        raise ProjectNotFound()
 
-    data = issue_service.get_issue(user.id, project.id, issue_number, db)
+    data = await issue_service.get_issue(
+        user.id, project.id, issue_number, db, async_db
+    )
     return issue_read_success(data)
 
 
@@ -123,22 +146,17 @@ def get_issue(
     summary="Create a new issue rescheduling",
     response_model=SuccessResponse[IssueReschedulingRes],
 )
-def create_issue_rescheduling(
+async def create_issue_rescheduling(
     issue_rescheduling_req: IssueReschedulingReq,
     discord_channel_id: str = Header(..., description="Discord Channel ID"),
     discord_user_id: str = Header(..., description="Discord User ID"),
     db: Session = Depends(get_db),
 ):
-    user = user_repository.find_user_by_discord_id(db, discord_user_id)
-    if not user:
-        raise UserNotFound()
-    project = project_repository.find_project_by_discord_channel_id(
-        db, discord_channel_id
+    user, project = await run_blocking(
+        find_user_and_project, discord_user_id, discord_channel_id, db
     )
-    if not project:
-        raise ProjectNotFound()
 
-    data = issue_rescheduling_service.create_issue_rescheduling(
+    data = await issue_rescheduling_service.create_issue_rescheduling(
         user.id, project.id, issue_rescheduling_req, db
     )
     return issue_rescheduling_create_success(data)
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, TypeVar
+
+from src.config.config import (
+    BLOCKING_POOL_SIZE,
+    LOOP_LAG_DEBUG,
+    LOOP_LAG_INTERVAL_SECONDS,
+    LOOP_LAG_THRESHOLD_SECONDS,
+)
+from src.config.logger_config import setup_logger
+
+T = TypeVar("T")
+
+logger = setup_logger(__name__)
+
+blocking_executor: ThreadPoolExecutor | None = None
+loop_lag_task: asyncio.Task | None = None
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Returns the shared thread pool for blocking work (sync DB, file parsing)
+    """
+    global blocking_executor
+    if blocking_executor is None:
+        blocking_executor = ThreadPoolExecutor(
+            max_workers=BLOCKING_POOL_SIZE, thread_name_prefix="blocking"
+        )
+    return blocking_executor
+
+
+def shutdown_blocking_executor():
+    """
+    Shut the blocking thread pool down (called on server shutdown)
+    """
+    global blocking_executor
+    if blocking_executor is not None:
+        blocking_executor.shutdown(wait=False, cancel_futures=True)
+        blocking_executor = None
+        logger.info("✅ Blocking executor closed")
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking function in the blocking thread pool and await its result
+
+    Context variables (e.g. trace id) are carried into the worker thread
+    """
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(
+        get_blocking_executor(), call
+    )
+
+
+def to_async(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Wrap a blocking function into a coroutine function running in the pool
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+
+    return wrapper
+
+
+async def monitor_loop_lag():
+    """
+    Log when the event loop was blocked longer than LOOP_LAG_THRESHOLD_SECONDS
+    """
+    while True:
+        started_at = time.monotonic()
+        await asyncio.sleep(LOOP_LAG_INTERVAL_SECONDS)
+        lag = time.monotonic() - started_at - LOOP_LAG_INTERVAL_SECONDS
+        if lag > LOOP_LAG_THRESHOLD_SECONDS:
+            logger.warning(f"Event loop was blocked for {lag:.3f}s")
+
+
+def start_loop_lag_monitor():
+    """
+    Start the loop lag monitor (called on server startup)
+
+    With LOOP_LAG_DEBUG, asyncio debug mode also logs the slow callback itself
+    """
+    global loop_lag_task
+    loop = asyncio.get_running_loop()
+    if LOOP_LAG_DEBUG:
+        loop.set_debug(True)
+        loop.slow_callback_duration = LOOP_LAG_THRESHOLD_SECONDS
+
+    if loop_lag_task is None:
+        loop_lag_task = loop.create_task(monitor_loop_lag())
+        logger.info("✅ Loop lag monitor started")
+
+
+def stop_loop_lag_monitor():
+    """
+    Stop the loop lag monitor (called on server shutdown)
+    """
+    global loop_lag_task
+    if loop_lag_task is not None:
+        loop_lag_task.cancel()
+        loop_lag_task = None
@@ -1,10 +1,21 @@
-import requests
+import httpx
 from sqlalchemy.orm import Session
 
+from src.common.util.executor import to_async
+from src.common.util.github_client import GITHUB_URL, github_get
+from src.common.util.lru_cache import LRUCache
+from src.config.config import (
+    GITHUB_REPO_EXISTS_CACHE_MAX_ENTRIES,
+    GITHUB_REPO_EXISTS_TTL_SECONDS,
+    GITHUB_REPO_MISSING_TTL_SECONDS,
+)
 from src.response.error_definitions import GitHubApiError
 from src.user.repository import find_user_by_user_id
 
-GITHUB_URL = "https://api.github.com"
+# (user_id, repo_fullname) -> exists
+repo_exists_cache: LRUCache[tuple[int, str], bool] = LRUCache(
+    GITHUB_REPO_EXISTS_CACHE_MAX_ENTRIES
+)
 
 
 def get_github_access_token_from_user(user_id: int, db: Session):
@@ -28,21 +39,55 @@ def get_github_headers(user_id: int, db: Session):
     return headers
 
 
-def check_github_repo_exists(user_id: int, repo_fullname: str, db: Session) -> bool:
+# get_github_headers for coroutines, the user lookup runs in the blocking pool
+aget_github_headers = to_async(get_github_headers)
+
+
+async def check_github_repo_exists(
+    user_id: int, repo_fullname: str, db: Session
+) -> bool:
     """
     Check if GitHub repository exists.
+
+    The result is memoized per (user_id, repo_fullname) for
+    GITHUB_REPO_EXISTS_TTL_SECONDS, or GITHUB_REPO_MISSING_TTL_SECONDS when
+    the repository was not found.
     """
+    key = (user_id, repo_fullname)
+    cached = repo_exists_cache.get(key)
+    if cached is not None:
+        return cached
+
     api_url = f"{GITHUB_URL}/repos/{repo_fullname}"
 
     try:
-        response = requests.get(api_url, headers=get_github_headers(user_id, db))
-
-        if response.status_code == 200:
-            return True  # Repository exists
-        elif response.status_code == 404:
-            return False  # Repository not found
-        else:
-            raise GitHubApiError(response.status_code)
+        response = await github_get(
+            api_url, headers=await aget_github_headers(user_id, db)
+        )
+    except httpx.HTTPError as e:
+        raise GitHubApiError(503, detail=str(e))
 
-    except requests.exceptions.RequestException as e:
+    if response.status_code == 200:
+        exists = True  # Repository exists
+        ttl = GITHUB_REPO_EXISTS_TTL_SECONDS
+    elif response.status_code == 404:
+        exists = False  # Repository not found
+        ttl = GITHUB_REPO_MISSING_TTL_SECONDS
+    else:
         raise GitHubApiError(response.status_code)
+
+    repo_exists_cache.set(key, exists, ttl_seconds=ttl)
+    return exists
+
+
+def invalidate_github_repo_exists(repo_fullname: str, user_id: int | None = None):
+    """
+    Drop memoized existence results of the repository (for every user if
+    user_id is not given)
+    """
+    if user_id is not None:
+        repo_exists_cache.pop((user_id, repo_fullname))
+        return
+
+    for key in [key for key in repo_exists_cache if key[1] == repo_fullname]:
+        repo_exists_cache.pop(key)
@@ -0,0 +1,64 @@
+import json
+
+from redis.exceptions import RedisError
+
+from src.auth.util.redis import redis_client
+from src.common.util.github_rate_limit import get_token_scope
+from src.common.util.lru_cache import LRUCache
+from src.config.config import (
+    GITHUB_CACHE_BACKEND,
+    GITHUB_CACHE_MAX_ENTRIES,
+    GITHUB_CACHE_TTL_SECONDS,
+)
+from src.config.logger_config import setup_logger
+
+GITHUB_CACHE_REDIS = "github_cache"
+
+logger = setup_logger(__name__)
+
+memory_cache: LRUCache[str, dict] = LRUCache(
+    GITHUB_CACHE_MAX_ENTRIES, GITHUB_CACHE_TTL_SECONDS
+)
+
+
+def make_cache_key(headers: dict, url: str) -> str:
+    """
+    Returns cache key scoped by the token (hashed) and the full request URL
+    """
+    return f"{GITHUB_CACHE_REDIS}:{get_token_scope(headers)}:{url}"
+
+
+def get_from_memory(key: str) -> dict | None:
+    return memory_cache.get(key)
+
+
+def save_to_memory(key: str, entry: dict):
+    memory_cache.set(key, entry)
+
+
+async def get_cached_response(key: str) -> dict | None:
+    """
+    Get cached GitHub response (etag, last_modified, link, body)
+
+    Falls back to the in-process LRU when Redis is not used or not reachable
+    """
+    if GITHUB_CACHE_BACKEND == "redis":
+        try:
+            cached = await redis_client.get(key)
+            return json.loads(cached) if cached else None
+        except RedisError as e:
+            logger.warning(f"GitHub cache read from redis failed: {e}")
+    return get_from_memory(key)
+
+
+async def save_cached_response(key: str, entry: dict):
+    """
+    Save GitHub response to cache
+    """
+    if GITHUB_CACHE_BACKEND == "redis":
+        try:
+            await redis_client.set(key, json.dumps(entry), ex=GITHUB_CACHE_TTL_SECONDS)
+            return
+        except RedisError as e:
+            logger.warning(f"GitHub cache write to redis failed: {e}")
+    save_to_memory(key, entry)
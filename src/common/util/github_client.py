@@ -0,0 +1,253 @@
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+
+from src.common.util.github_cache import (
+    get_cached_response,
+    make_cache_key,
+    save_cached_response,
+)
+from src.common.util.github_rate_limit import (
+    acquire_github_budget,
+    is_rate_limited,
+    update_github_budget,
+)
+from src.config.config import (
+    GITHUB_CACHE_ENABLED,
+    GITHUB_CONNECT_TIMEOUT,
+    GITHUB_HTTP2,
+    GITHUB_KEEPALIVE_EXPIRY,
+    GITHUB_MAX_CONNECTIONS,
+    GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+    GITHUB_PAGE_CONCURRENCY,
+    GITHUB_RATE_LIMIT_MAX_RETRIES,
+    GITHUB_TIMEOUT,
+)
+from src.config.logger_config import setup_logger
+from src.response.error_definitions import GitHubApiError
+
+GITHUB_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_URL}/graphql"
+GITHUB_PER_PAGE = 100
+GITHUB_EMPTY_REPOSITORY_MESSAGE = "Git Repository is empty."
+
+logger = setup_logger(__name__)
+
+github_client: httpx.AsyncClient | None = None
+
+
+def create_github_client() -> httpx.AsyncClient:
+    """
+    Create AsyncClient for GitHub API with keep-alive connection pooling
+    """
+    return httpx.AsyncClient(
+        base_url=GITHUB_URL,
+        http2=GITHUB_HTTP2,
+        headers={"Accept": "application/vnd.github+json"},
+        limits=httpx.Limits(
+            max_connections=GITHUB_MAX_CONNECTIONS,
+            max_keepalive_connections=GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=GITHUB_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(GITHUB_TIMEOUT, connect=GITHUB_CONNECT_TIMEOUT),
+    )
+
+
+def init_github_client():
+    """
+    Open the app-scoped GitHub client (called on server startup)
+    """
+    global github_client
+    if github_client is None:
+        github_client = create_github_client()
+        logger.info("✅ GitHub client initialized")
+
+
+async def close_github_client():
+    """
+    Close the app-scoped GitHub client (called on server shutdown)
+    """
+    global github_client
+    if github_client is not None:
+        await github_client.aclose()
+        github_client = None
+        logger.info("✅ GitHub client closed")
+
+
+def get_github_client() -> httpx.AsyncClient:
+    """
+    Returns the shared GitHub client, creating it if the lifespan has not run
+    """
+    if github_client is None:
+        init_github_client()
+    return github_client
+
+
+async def github_request(
+    method: str, url: str, headers: dict, **kwargs
+) -> httpx.Response:
+    """
+    Send a request through the per-token rate limit budget
+
+    Waits while the token's budget is exhausted or GitHub asked to back off
+    (Retry-After, secondary rate limit). GET requests rejected by the rate limit
+    are retried after the backoff up to GITHUB_RATE_LIMIT_MAX_RETRIES times.
+    """
+    client = get_github_client()
+    request_url = str(client.build_request(method, url).url)
+    retries = GITHUB_RATE_LIMIT_MAX_RETRIES if method == "GET" else 0
+
+    for _ in range(retries + 1):
+        await acquire_github_budget(headers, request_url)
+        response = await client.request(method, url, headers=headers, **kwargs)
+        update_github_budget(headers, request_url, response)
+        if not is_rate_limited(response):
+            break
+    return response
+
+
+async def github_get(
+    url: str, headers: dict, params: dict | None = None
+) -> httpx.Response:
+    """
+    Conditional GET against GitHub API
+
+    Sends If-None-Match / If-Modified-Since from the cached response and serves
+    304 Not Modified from the cache (304s do not count against the rate limit).
+    """
+    client = get_github_client()
+    if not GITHUB_CACHE_ENABLED:
+        return await github_request("GET", url, headers=headers, params=params)
+
+    request_url = str(client.build_request("GET", url, params=params).url)
+    key = make_cache_key(headers, request_url)
+    cached = await get_cached_response(key)
+
+    conditional_headers = dict(headers)
+    if cached:
+        if cached.get("etag"):
+            conditional_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = await github_request(
+        "GET", url, headers=conditional_headers, params=params
+    )
+
+    if response.status_code == 304 and cached:
+        cached_headers = {"Content-Type": "application/json"}
+        if cached.get("link"):
+            cached_headers["Link"] = cached["link"]
+        return httpx.Response(
+            200,
+            headers=cached_headers,
+            content=cached["body"].encode(),
+            request=response.request,
+        )
+
+    if response.status_code == 200 and (
+        "ETag" in response.headers or "Last-Modified" in response.headers
+    ):
+        await save_cached_response(
+            key,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "link": response.headers.get("Link"),
+                "body": response.text,
+            },
+        )
+
+    return response
+
+
+def raise_github_api_error(response: httpx.Response):
+    """
+    Raise GitHubApiError with the message GitHub sent back
+    """
+    try:
+        error_message = response.json().get("message", "")
+    except Exception:
+        error_message = response.text or "No error message provided"
+    raise GitHubApiError(response.status_code, detail=error_message)
+
+
+async def github_graphql(query: str, variables: dict, headers: dict) -> dict:
+    """
+    Run a GitHub GraphQL (v4) query and return its data
+
+    Errors next to partial data (e.g. a repository that is not accessible) are
+    logged and the partial data is returned.
+    """
+    response = await github_request(
+        "POST",
+        GITHUB_GRAPHQL_URL,
+        headers=headers,
+        json={"query": query, "variables": variables},
+    )
+    if response.status_code != 200:
+        raise_github_api_error(response)
+
+    payload = response.json()
+    errors = payload.get("errors") or []
+    error_message = "; ".join(error.get("message", "") for error in errors)
+    if payload.get("data") is None:
+        raise GitHubApiError(response.status_code, detail=error_message)
+    if errors:
+        logger.warning(f"GitHub GraphQL returned partial data: {error_message}")
+    return payload["data"]
+
+
+def get_last_page(response: httpx.Response) -> int:
+    """
+    Returns the last page number from the Link header (1 if there is no next page)
+    """
+    last = response.links.get("last")
+    if not last:
+        return 1
+    return int(httpx.URL(last["url"]).params.get("page", 1))
+
+
+async def fetch_page(url: str, headers: dict, params: dict) -> httpx.Response:
+    response = await github_get(url, headers=headers, params=params)
+    if response.status_code != 200:
+        raise_github_api_error(response)
+    return response
+
+
+async def paginate(
+    url: str, headers: dict, params: dict | None = None
+) -> AsyncIterator[dict]:
+    """
+    Iterate over every item of a paginated GitHub list endpoint
+
+    Reads the first page with per_page=100, takes the last page number from the
+    Link header and fetches the remaining pages concurrently
+    (GITHUB_PAGE_CONCURRENCY at a time). Items are yielded in page order.
+    An empty repository yields nothing.
+    """
+    params = {**(params or {}), "per_page": GITHUB_PER_PAGE}
+
+    response = await github_get(url, headers=headers, params={**params, "page": 1})
+    if response.status_code == 409:
+        try:
+            if response.json().get("message") == GITHUB_EMPTY_REPOSITORY_MESSAGE:
+                return
+        except ValueError:
+            pass
+    if response.status_code != 200:
+        raise_github_api_error(response)
+
+    for item in response.json():
+        yield item
+
+    last_page = get_last_page(response)
+    for start in range(2, last_page + 1, GITHUB_PAGE_CONCURRENCY):
+        pages = range(start, min(start + GITHUB_PAGE_CONCURRENCY, last_page + 1))
+        responses = await asyncio.gather(
+            *(fetch_page(url, headers, {**params, "page": page}) for page in pages)
+        )
+        for response in responses:
+            for item in response.json():
+                yield item
@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+
+import httpx
+
+from src.config.config import (
+    GITHUB_RATE_LIMIT_BACKGROUND_MAX_WAIT_SECONDS,
+    GITHUB_RATE_LIMIT_BACKGROUND_RESERVE,
+    GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS,
+    GITHUB_SECONDARY_RATE_LIMIT_BACKOFF_SECONDS,
+)
+from src.config.logger_config import setup_logger
+from src.response.error_definitions import GitHubRateLimitExceeded
+
+logger = setup_logger(__name__)
+
+
+class GitHubPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+github_priority_var: ContextVar[GitHubPriority] = ContextVar(
+    "github_priority", default=GitHubPriority.INTERACTIVE
+)
+
+
+def set_github_priority(priority: GitHubPriority):
+    """
+    Set the priority of GitHub requests made by the current request/task
+    """
+    github_priority_var.set(priority)
+
+
+def get_github_priority() -> GitHubPriority:
+    return github_priority_var.get()
+
+
+@dataclass
+class GitHubBudget:
+    scope: str
+    resource: str
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    waiting: int = 0
+
+
+# (token scope, resource) -> budget
+budgets: dict[tuple[str, str], GitHubBudget] = {}
+
+
+def get_token_scope(headers: dict) -> str:
+    """
+    Returns the hashed Authorization header, so raw tokens are never kept
+    """
+    authorization = headers.get("Authorization", "")
+    return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+
+def get_resource(url: str) -> str:
+    """
+    Returns the GitHub rate limit resource the request is counted against
+    """
+    path = httpx.URL(url).path
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+def get_budget(scope: str, resource: str) -> GitHubBudget:
+    key = (scope, resource)
+    if key not in budgets:
+        budgets[key] = GitHubBudget(scope=scope, resource=resource)
+    return budgets[key]
+
+
+def get_wait_seconds(budget: GitHubBudget, priority: GitHubPriority) -> float:
+    """
+    Returns how long the request has to wait before it may be sent
+
+    Background requests stop at GITHUB_RATE_LIMIT_BACKGROUND_RESERVE so the rest
+    of the budget stays available to interactive requests.
+    """
+    now = time.time()
+    if budget.blocked_until > now:
+        return budget.blocked_until - now
+
+    reserve = (
+        GITHUB_RATE_LIMIT_BACKGROUND_RESERVE
+        if priority == GitHubPriority.BACKGROUND
+        else 0
+    )
+    if (
+        budget.remaining is not None
+        and budget.remaining <= reserve
+        and budget.reset_at > now
+    ):
+        return budget.reset_at - now
+    return 0.0
+
+
+async def acquire_github_budget(headers: dict, url: str):
+    """
+    Wait until the token has budget left for the request
+
+    Raises GitHubRateLimitExceeded when the wait would be longer than the
+    priority allows.
+    """
+    budget = get_budget(get_token_scope(headers), get_resource(url))
+    priority = get_github_priority()
+    max_wait = (
+        GITHUB_RATE_LIMIT_BACKGROUND_MAX_WAIT_SECONDS
+        if priority == GitHubPriority.BACKGROUND
+        else GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS
+    )
+
+    while True:
+        wait = get_wait_seconds(budget, priority)
+        if wait <= 0:
+            break
+        if wait > max_wait:
+            raise GitHubRateLimitExceeded(int(wait) + 1)
+
+        logger.info(
+            f"GitHub {budget.resource} budget exhausted, waiting {wait:.1f}s "
+            f"({priority.name.lower()})"
+        )
+        budget.waiting += 1
+        try:
+            await asyncio.sleep(wait)
+        finally:
+            budget.waiting -= 1
+
+    # Count the request before it is sent so concurrent requests see it
+    if budget.remaining is not None:
+        budget.remaining = max(budget.remaining - 1, 0)
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    """
+    Check if GitHub rejected the request by the primary or secondary rate limit
+    """
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    if "Retry-After" in response.headers:
+        return True
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    return "rate limit" in response.text.lower()
+
+
+def update_github_budget(headers: dict, url: str, response: httpx.Response):
+    """
+    Update the budget from X-RateLimit-* and Retry-After response headers
+    """
+    resource = response.headers.get("X-RateLimit-Resource") or get_resource(url)
+    budget = get_budget(get_token_scope(headers), resource)
+
+    if "X-RateLimit-Remaining" in response.headers:
+        budget.limit = int(response.headers.get("X-RateLimit-Limit", 0)) or None
+        budget.remaining = int(response.headers["X-RateLimit-Remaining"])
+        budget.reset_at = float(response.headers.get("X-RateLimit-Reset", 0))
+
+    if not is_rate_limited(response):
+        return
+
+    now = time.time()
+    if "Retry-After" in response.headers:
+        blocked_until = now + float(response.headers["Retry-After"])
+    elif budget.remaining == 0 and budget.reset_at > now:
+        blocked_until = budget.reset_at
+    else:
+        # Secondary rate limit without Retry-After: GitHub asks for at least a minute
+        blocked_until = now + GITHUB_SECONDARY_RATE_LIMIT_BACKOFF_SECONDS
+
+    budget.blocked_until = max(budget.blocked_until, blocked_until)
+    logger.warning(
+        f"GitHub {resource} rate limit hit, backing off for "
+        f"{budget.blocked_until - now:.0f}s"
+    )
+
+
+def get_github_budgets() -> list[dict]:
+    """
+    Returns the current budget of every token seen by this worker
+    """
+    now = time.time()
+    return [
+        {
+            "scope": budget.scope[:8],
+            "resource": budget.resource,
+            "limit": budget.limit,
+            "remaining": budget.remaining,
+            "reset_in_seconds": max(int(budget.reset_at - now), 0),
+            "blocked_for_seconds": max(int(budget.blocked_until - now), 0),
+            "waiting": budget.waiting,
+        }
+        for budget in budgets.values()
+    ]
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    In-process LRU cache bounded to max_entries, with optional expiry
+
+    Entries expire after ttl_seconds (or at the expires_at given to set) on the
+    clock, expired entries are dropped when they are read. Not shared between
+    workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # key -> (expires_at, value)
+        self.entries: OrderedDict[K, tuple[Optional[float], V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.clock():
+            self.entries.pop(key, None)
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl_seconds: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ):
+        """
+        Save the value, evicting the least recently used entries over
+        max_entries
+
+        ttl_seconds overrides the cache's ttl, expires_at (on the cache's clock)
+        overrides both
+        """
+        if expires_at is None:
+            ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+            if ttl_seconds is not None:
+                expires_at = self.clock() + ttl_seconds
+
+        self.entries[key] = (expires_at, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: K):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self.entries))
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,79 @@
+import importlib.util
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.config.config import ASYNC_DATABASE_URL, DATABASE_URL
+from src.config.logger_config import setup_logger
+from src.config.pool_metrics import get_pool_options, instrument_engine
+from src.response.error_definitions import SQLError
+
+# asyncmy and aiosqlite are dependencies, aiomysql is picked up when installed
+ASYNC_DRIVERS = {
+    "mysql": ["asyncmy", "aiomysql"],
+    "sqlite": ["aiosqlite"],
+}
+
+logger = setup_logger(__name__)
+
+
+def get_async_database_url() -> str | None:
+    """
+    Returns ASYNC_DATABASE_URL, or DATABASE_URL with the first installed async
+    driver (None if there is none)
+    """
+    if ASYNC_DATABASE_URL:
+        return ASYNC_DATABASE_URL
+    if not DATABASE_URL:
+        return None
+
+    url = make_url(DATABASE_URL)
+    backend = url.get_backend_name()
+    for driver in ASYNC_DRIVERS.get(backend, []):
+        if importlib.util.find_spec(driver) is not None:
+            return url.set(drivername=f"{backend}+{driver}").render_as_string(
+                hide_password=False
+            )
+    return None
+
+
+async_database_url = get_async_database_url()
+async_engine = None
+if async_database_url:
+    async_engine = create_async_engine(
+        async_database_url,
+        echo=False,
+        **get_pool_options(async_database_url, "async", AsyncAdaptedQueuePool),
+    )
+    instrument_engine(async_engine.sync_engine, "async")
+
+async_session = (
+    async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    if async_engine
+    else None
+)
+
+
+async def dispose_async_engine():
+    """
+    Close pooled async connections (called on server shutdown)
+    """
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+async def get_async_db():
+    """
+    Create SQLAlchemy AsyncSession
+    """
+    if async_session is None:
+        logger.error("No async database driver is installed (asyncmy, aiosqlite)")
+        raise SQLError()
+
+    async with async_session() as db:
+        try:
+            yield db
+        except SQLAlchemyError:
+            raise SQLError()
@@ -7,24 +7,119 @@ load_dotenv()
 # Local
 IS_LOCAL = os.getenv("IS_LOCAL", "0") == "1"
 
+# Logging
+LOG_DIR = os.getenv("LOG_DIR", "logs")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # text, json
+
 # GitHub
 GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
 GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI")
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
+
+# GitHub API Client
+GITHUB_HTTP2 = os.getenv("GITHUB_HTTP2", "1") == "1"
+GITHUB_MAX_CONNECTIONS = int(os.getenv("GITHUB_MAX_CONNECTIONS", "100"))
+GITHUB_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("GITHUB_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+GITHUB_KEEPALIVE_EXPIRY = float(os.getenv("GITHUB_KEEPALIVE_EXPIRY", "30"))
+GITHUB_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", "10"))
+GITHUB_CONNECT_TIMEOUT = float(os.getenv("GITHUB_CONNECT_TIMEOUT", "5"))
+GITHUB_PAGE_CONCURRENCY = int(os.getenv("GITHUB_PAGE_CONCURRENCY", "5"))
+GITHUB_DETAIL_CONCURRENCY = int(os.getenv("GITHUB_DETAIL_CONCURRENCY", "10"))
+GITHUB_REPO_CONCURRENCY = int(os.getenv("GITHUB_REPO_CONCURRENCY", "4"))
+GITHUB_REPO_TIMEOUT_SECONDS = float(os.getenv("GITHUB_REPO_TIMEOUT_SECONDS", "60"))
+GITHUB_GRAPHQL_ENABLED = os.getenv("GITHUB_GRAPHQL_ENABLED", "1") == "1"
+GITHUB_GRAPHQL_SEARCH_REPOS = int(os.getenv("GITHUB_GRAPHQL_SEARCH_REPOS", "5"))
+
+# GitHub Response Cache (ETag)
+GITHUB_CACHE_ENABLED = os.getenv("GITHUB_CACHE_ENABLED", "1") == "1"
+GITHUB_CACHE_BACKEND = os.getenv("GITHUB_CACHE_BACKEND", "redis")  # redis, memory
+GITHUB_CACHE_TTL_SECONDS = int(os.getenv("GITHUB_CACHE_TTL_SECONDS", "86400"))
+GITHUB_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "1024"))
+
+# GitHub OAuth Profile Cache
+GITHUB_PROFILE_CACHE_TTL_SECONDS = int(
+    os.getenv("GITHUB_PROFILE_CACHE_TTL_SECONDS", "300")
+)
+GITHUB_PROFILE_CACHE_MAX_ENTRIES = int(
+    os.getenv("GITHUB_PROFILE_CACHE_MAX_ENTRIES", "1024")
+)
+
+# GitHub Repository Existence Cache
+GITHUB_REPO_EXISTS_TTL_SECONDS = int(os.getenv("GITHUB_REPO_EXISTS_TTL_SECONDS", "300"))
+GITHUB_REPO_MISSING_TTL_SECONDS = int(
+    os.getenv("GITHUB_REPO_MISSING_TTL_SECONDS", "30")
+)
+GITHUB_REPO_EXISTS_CACHE_MAX_ENTRIES = int(
+    os.getenv("GITHUB_REPO_EXISTS_CACHE_MAX_ENTRIES", "4096")
+)
+
+# GitHub Rate Limit
+GITHUB_RATE_LIMIT_BACKGROUND_RESERVE = int(
+    os.getenv("GITHUB_RATE_LIMIT_BACKGROUND_RESERVE", "500")
+)
+GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS = float(
+    os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS", "10")
+)
+GITHUB_RATE_LIMIT_BACKGROUND_MAX_WAIT_SECONDS = float(
+    os.getenv("GITHUB_RATE_LIMIT_BACKGROUND_MAX_WAIT_SECONDS", "300")
+)
+GITHUB_RATE_LIMIT_MAX_RETRIES = int(os.getenv("GITHUB_RATE_LIMIT_MAX_RETRIES", "2"))
+GITHUB_SECONDARY_RATE_LIMIT_BACKOFF_SECONDS = float(
+    os.getenv("GITHUB_SECONDARY_RATE_LIMIT_BACKOFF_SECONDS", "60")
+)
+
+# Auth User Cache
+USER_CACHE_BACKEND = os.getenv("USER_CACHE_BACKEND", "memory")  # memory, redis
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
 
 # Jwt
 JWT_SECRET = os.getenv("JWT_SECRET")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
 REFRESH_TOKEN_EXPIRE_DAYS = os.getenv("REFRESH_TOKEN_EXPIRE_DAYS")
+JWT_CACHE_MAX_ENTRIES = int(os.getenv("JWT_CACHE_MAX_ENTRIES", "10000"))
 
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")  # Defaults to DATABASE_URL
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # Below MySQL wait_timeout
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Blocking Executor
+# Async handlers run their DB work here, so by default the pool can use every
+# connection of the DB pool
+BLOCKING_POOL_SIZE = int(
+    os.getenv("BLOCKING_POOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW))
+)
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+LOOP_LAG_THRESHOLD_SECONDS = float(os.getenv("LOOP_LAG_THRESHOLD_SECONDS", "0.1"))
+LOOP_LAG_DEBUG = os.getenv("LOOP_LAG_DEBUG", "0") == "1"
+
+# Issue Mirror
+ISSUE_MIRROR_ENABLED = os.getenv("ISSUE_MIRROR_ENABLED", "1") == "1"
+ISSUE_MIRROR_MAX_AGE_SECONDS = int(os.getenv("ISSUE_MIRROR_MAX_AGE_SECONDS", "60"))
+ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS = int(
+    os.getenv("ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS", "3600")
+)
+# `since` margin for clock skew between this server and GitHub
+ISSUE_MIRROR_SINCE_SKEW_SECONDS = int(
+    os.getenv("ISSUE_MIRROR_SINCE_SKEW_SECONDS", "60")
+)
 
 # Redis
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = os.getenv("REDIS_PORT")
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "5"))
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "5"))
 
 # FastAPI
 FRONTEND_URL = os.getenv("FRONTEND_URL")
@@ -41,12 +136,24 @@ VERTEX_EMBEDDING_MODEL = os.getenv("VERTEX_EMBEDDING_MODEL")
 # Google Cloud
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
+# Agent
+# Set AGENT_ENDPOINTS_ENABLED=0 on workers that should never load the agent
+# stack and route /agent to a separate worker pool running with it enabled
+AGENT_ENDPOINTS_ENABLED = os.getenv("AGENT_ENDPOINTS_ENABLED", "1") == "1"
+# Off by default so workers load the agent stack on the first agent request,
+# turn it on for the dedicated agent worker pool
+AGENT_WARM_UP = os.getenv("AGENT_WARM_UP", "0") == "1"
+
 # Swagger
 SWAGGER_USERNAME = os.getenv("SWAGGER_USERNAME")
 SWAGGER_PASSWORD = os.getenv("SWAGGER_PASSWORD")
 
 # Errorping
 DISCORD_CHANNEL_ID = os.getenv("DISCORD_CHANNEL_ID")
+ERROR_REPORT_QUEUE_SIZE = int(os.getenv("ERROR_REPORT_QUEUE_SIZE", "1000"))
+ERROR_REPORT_BATCH_SIZE = int(os.getenv("ERROR_REPORT_BATCH_SIZE", "50"))
+ERROR_REPORT_FLUSH_SECONDS = float(os.getenv("ERROR_REPORT_FLUSH_SECONDS", "2"))
+ERROR_REPORT_WINDOW_SECONDS = float(os.getenv("ERROR_REPORT_WINDOW_SECONDS", "60"))
 
 # Coordipai Bot
 COORDIPAI_BOT_URL = os.getenv("COORDIPAI_BOT_URL")
@@ -2,12 +2,17 @@ from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.config.config import DATABASE_URL
 from src.config.logger_config import setup_logger
+from src.config.pool_metrics import get_pool_options, instrument_engine
 from src.response.error_definitions import SQLError
 
-engine = create_engine(DATABASE_URL, echo=False)
+engine = create_engine(
+    DATABASE_URL, echo=False, **get_pool_options(DATABASE_URL, "sync", QueuePool)
+)
+instrument_engine(engine, "sync")
 session = sessionmaker(bind=engine)
 
 Base = declarative_base()
@@ -25,6 +30,13 @@ def initialize_database():
     logger.info("✅ Database Initializing complete!")
 
 
+def create_missing_tables():
+    """
+    Create tables that do not exist yet (existing tables are left untouched)
+    """
+    Base.metadata.create_all(bind=engine)
+
+
 def get_db():
     """
     Create SQLAlchemy Sessoin
@@ -1,21 +1,67 @@
 # logger_config.py
+import atexit
+import json
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 import colorlog
 
+from src.config.config import LOG_DIR, LOG_FORMAT
+from src.config.trace_config import get_trace_id
 
-def setup_logger(name):
+# Every logger puts records on this queue, a single listener thread writes them
+# to the console and the daily file, so no disk I/O happens on the event loop
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener: logging.handlers.QueueListener | None = None
+
+# Loggers whose records also go to the daily file
+file_logger_names: set[str] = set()
+
+
+class TraceIdFilter(logging.Filter):
     """
-    Sets and returns a logger.
+    Attach the trace id while the record is still in the request's context
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)  # Set logging level
 
-    # Console handler (print color)
+    def filter(self, record):
+        record.trace_id = get_trace_id()
+        return True
+
+
+class FileLoggerFilter(logging.Filter):
+    def filter(self, record):
+        return record.name in file_logger_names
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as JSON lines
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "trace_id", ""):
+            entry["trace_id"] = record.trace_id
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def create_console_handler() -> logging.Handler:
     console_handler = logging.StreamHandler()
+    if LOG_FORMAT == "json":
+        console_handler.setFormatter(JsonFormatter())
+        return console_handler
+
+    # Print color
     console_formatter = colorlog.ColoredFormatter(
         "%(log_color)s%(asctime)s - %(name)s - %(levelname)-8s%(reset)s %(blue)s%(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -31,15 +77,10 @@ def setup_logger(name):
         style="%",
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    return logger
+    return console_handler
 
 
-def add_daily_file_handler(logger, log_dir="logs"):
-    """
-    Add a handler to the logger to save to a file by date.
-    """
+def create_daily_file_handler(log_dir: str) -> logging.Handler:
     # Create log directory
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -52,9 +93,72 @@ def add_daily_file_handler(logger, log_dir="logs"):
         interval=1,  # 1 day interval
         backupCount=7,  # Keep 7 days worth of log files
         encoding="utf-8",
+        delay=True,  # Open the file on the first record
     )
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    if LOG_FORMAT == "json":
+        file_formatter = JsonFormatter()
+    else:
+        file_formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
     daily_handler.setFormatter(file_formatter)
-    logger.addHandler(daily_handler)
+    daily_handler.addFilter(FileLoggerFilter())
+    return daily_handler
+
+
+def start_log_listener():
+    """
+    Start the listener thread writing queued records (once per process)
+    """
+    global log_listener
+    if log_listener is not None:
+        return
+
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        create_console_handler(),
+        create_daily_file_handler(LOG_DIR),
+        respect_handler_level=True,
+    )
+    log_listener.start()
+    atexit.register(stop_log_listener)
+
+
+def stop_log_listener():
+    """
+    Write the remaining records and stop the listener thread
+    """
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
+
+
+def setup_logger(name):
+    """
+    Sets and returns a logger.
+
+    Safe to call repeatedly, the logger gets a single queue handler.
+    """
+    start_log_listener()
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)  # Set logging level
+
+    if not any(
+        isinstance(handler, logging.handlers.QueueHandler)
+        for handler in logger.handlers
+    ):
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(TraceIdFilter())
+        logger.addHandler(queue_handler)
+
+    return logger
+
+
+def add_daily_file_handler(logger):
+    """
+    Save the logger's records to a file by date as well (the file handler is
+    shared by every logger).
+    """
+    file_logger_names.add(logger.name)
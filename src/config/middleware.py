@@ -2,13 +2,18 @@ import traceback
 import uuid
 
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.auth.util.jwt import parse_token
+from src.auth.util.user_cache import is_known_user, remember_user
+from src.common.util.executor import run_blocking
+from src.config.async_database import async_session
 from src.config.config import DISCORD_CHANNEL_ID
-from src.config.database import get_db
+from src.config.database import session
 from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.config.route_policy import RoutePolicy, get_route_policy
 from src.config.trace_config import set_trace_id
 from src.models import User
 from src.response.error_definitions import (
@@ -18,108 +23,143 @@ from src.response.error_definitions import (
 )
 from src.response.report_error import report_error_to_discord
 from src.response.schemas import ErrorResponse
+from src.user import async_repository as user_async_repository
 
 logger = setup_logger(__name__)
 add_daily_file_handler(logger)
 
 
-class JWTAuthenticationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+async def user_exists(user_id: int) -> bool:
+    """
+    Check the user is in the DB
+
+    Uses the AsyncSession, or the sync session in the blocking pool when there is
+    no async driver for the database
+    """
+    if async_session is None:
+        return await run_blocking(sync_user_exists, user_id)
+
+    async with async_session() as db:
+        user = await user_async_repository.find_user_by_user_id(db, user_id)
+        return user is not None
+
+
+def sync_user_exists(user_id: int) -> bool:
+    """
+    Check the user is in the DB (blocking, run in the blocking pool)
+    """
+    db = session()
+    try:
+        return db.query(User.id).filter(User.id == user_id).first() is not None
+    finally:
+        db.close()
+
+
+class JWTAuthenticationMiddleware:
+    """
+    Pure ASGI middleware (BaseHTTPMiddleware buffers streaming responses and
+    runs every request in an extra task)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         trace_id = str(uuid.uuid4())
         set_trace_id(trace_id)
 
-        auth_allow_paths = [
-            "/auth/github/login",
-            "/auth/github/callback",
-            "/auth/login",
-            "/auth/register",
-            "/auth/refresh",
-            "/bot/test-scheduler",
-        ]
-        api_docs_allow_paths = ["/docs", "/openapi.json"]
-        discord_bot_allow_paths = ["/bot"]
-
-        if any(request.url.path.startswith(path) for path in auth_allow_paths):
-            response = await call_next(request)
-            response.headers["Trace-ID"] = trace_id
-            return response
-
-        if any(request.url.path.startswith(path) for path in api_docs_allow_paths):
-            response = await call_next(request)
-            response.headers["Trace-ID"] = trace_id
-            return response
+        async def send_with_trace_id(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["Trace-ID"] = trace_id
+            await send(message)
 
-        if request.method == "OPTIONS":
-            response = await call_next(request)
-            response.headers["Trace-ID"] = trace_id
-            return response
-
-        is_discord_bot = request.headers.get("Discord-Bot") == "true"
-        if is_discord_bot and any(
-            request.url.path.startswith(path) for path in discord_bot_allow_paths
-        ):
-            response = await call_next(request)
-            response.headers["Trace-ID"] = trace_id
-            return response
+        request = Request(scope)
+        if self.is_public(request):
+            await self.app(scope, receive, send_with_trace_id)
+            return
 
         try:
-            # Extract Authorization header
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                raise JwtTokenNotFound()
-
-            access_token = auth_header[7:]  # Remove 'Bearer '
-
-            try:
-                user_id = parse_token(access_token)
-                
-                # Check user exists
-                for db in get_db():
-                    user = db.query(User).filter(User.id == int(user_id)).first()
-                    if not user:
-                        raise InvalidJwtToken()
-                    break
-                
-                request.state.user_id = int(user_id)
-            except ValueError as e:
-                raise InvalidJwtToken(reason=str(e))
-
-            response = await call_next(request)
-            response.headers["Trace-ID"] = trace_id
-            return response
+            request.state.user_id = await self.authenticate(request)
         except BaseAppException as exc:
-            type = exc.type
-            title = exc.title
-            status_code = exc.status_code
-            path = request.url.path
-            detail = exc.detail
-            method = request.method
-            stack_trace = traceback.format_exc()
-
-            logger.error(f"{exc.status_code} - {exc.title}")
-
-            if status_code >= 500:
-                await report_error_to_discord(
-                    discord_channel_id=DISCORD_CHANNEL_ID,
-                    trace_id=trace_id,
-                    type=type,
-                    title=title,
-                    status=status_code,
-                    detail=detail,
-                    instance=path,
-                    method=method,
-                    trace=stack_trace,
-                )
-
-            response = JSONResponse(
-                status_code=status_code,
-                headers={"Access-Control-Allow-Origin": "http://localhost:5173"},
-                content=ErrorResponse(
-                    method=method,
-                    path=path,
-                    title=title,
-                    detail=detail,
-                ).model_dump(),
+            response = await self.error_response(request, exc, trace_id)
+            await response(scope, receive, send_with_trace_id)
+            return
+
+        await self.app(scope, receive, send_with_trace_id)
+
+    @staticmethod
+    def is_public(request: Request) -> bool:
+        if request.method == "OPTIONS":
+            return True
+
+        policy = get_route_policy(request.url.path)
+        if policy == RoutePolicy.BOT:
+            return request.headers.get("Discord-Bot") == "true"
+        return policy in (RoutePolicy.PUBLIC, RoutePolicy.DOCS)
+
+    @staticmethod
+    async def authenticate(request: Request) -> int:
+        """
+        Returns the user id of the Bearer token
+        """
+        # Extract Authorization header
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            raise JwtTokenNotFound()
+
+        access_token = auth_header[7:]  # Remove 'Bearer '
+
+        try:
+            user_id = int(parse_token(access_token))
+        except ValueError as e:
+            raise InvalidJwtToken(reason=str(e))
+
+        # Check user exists (recently confirmed users skip the DB)
+        if not await is_known_user(user_id):
+            if not await user_exists(user_id):
+                raise InvalidJwtToken()
+            await remember_user(user_id)
+
+        return user_id
+
+    @staticmethod
+    async def error_response(
+        request: Request, exc: BaseAppException, trace_id: str
+    ) -> JSONResponse:
+        type = exc.type
+        title = exc.title
+        status_code = exc.status_code
+        path = request.url.path
+        detail = exc.detail
+        method = request.method
+        stack_trace = traceback.format_exc()
+
+        logger.error(f"{exc.status_code} - {exc.title}")
+
+        if status_code >= 500:
+            await report_error_to_discord(
+                discord_channel_id=DISCORD_CHANNEL_ID,
+                trace_id=trace_id,
+                type=type,
+                title=title,
+                status=status_code,
+                detail=detail,
+                instance=path,
+                method=method,
+                trace=stack_trace,
             )
-            response.headers["Trace-ID"] = trace_id
-            return response
+
+        return JSONResponse(
+            status_code=status_code,
+            headers={"Access-Control-Allow-Origin": "http://localhost:5173"},
+            content=ErrorResponse(
+                method=method,
+                path=path,
+                title=title,
+                detail=detail,
+            ).model_dump(),
+        )
@@ -0,0 +1,133 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+from src.config.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    checkout_timeouts: int = 0
+    checkout_waits: int = 0
+    checkout_wait_total_seconds: float = 0.0
+    checkout_wait_max_seconds: float = 0.0
+    connects: int = 0
+    invalidations: int = 0
+
+
+# engine name -> metrics
+pool_metrics: dict[str, PoolMetrics] = {}
+engines: dict[str, Engine] = {}
+
+
+def get_pool_options(database_url: str, name: str, pool_class: type[Pool]) -> dict:
+    """
+    Returns create_engine pool options from config, with the pool class
+    instrumented for checkout wait time
+
+    SQLite uses SingletonThreadPool/StaticPool, which take none of them
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": instrumented_pool_class(pool_class, name),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_timeout": DB_POOL_TIMEOUT,
+    }
+
+
+def instrumented_pool_class(base: type[Pool], name: str) -> type[Pool]:
+    """
+    Returns a subclass of the pool class that records how long checkouts wait
+    for a connection
+    """
+    metrics = pool_metrics.setdefault(name, PoolMetrics())
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            started_at = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.checkout_timeouts += 1
+                raise
+            finally:
+                wait = time.perf_counter() - started_at
+                metrics.checkout_waits += 1
+                metrics.checkout_wait_total_seconds += wait
+                metrics.checkout_wait_max_seconds = max(
+                    metrics.checkout_wait_max_seconds, wait
+                )
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def instrument_engine(engine: Engine, name: str):
+    """
+    Count checkouts, new connections and invalidations with pool events
+
+    For an AsyncEngine, pass its sync_engine
+    """
+    metrics = pool_metrics.setdefault(name, PoolMetrics())
+    engines[name] = engine
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+
+def get_pool_metrics() -> list[dict]:
+    """
+    Returns pool status (size, in use, overflow) and checkout metrics of every
+    instrumented engine
+    """
+    result = []
+    for name, metrics in pool_metrics.items():
+        # The pool is replaced when the engine is disposed
+        pool = engines[name].pool if name in engines else None
+        # Only QueuePool tracks size/overflow (SQLite pools do not)
+        queue_pool = pool if isinstance(pool, QueuePool) else None
+        result.append(
+            {
+                "engine": name,
+                "pool": type(pool).__name__ if pool else None,
+                "size": queue_pool.size() if queue_pool else None,
+                "in_use": queue_pool.checkedout() if queue_pool else None,
+                "idle": queue_pool.checkedin() if queue_pool else None,
+                "overflow": queue_pool.overflow() if queue_pool else None,
+                "checkouts": metrics.checkouts,
+                "checkout_timeouts": metrics.checkout_timeouts,
+                "checkout_wait_avg_seconds": (
+                    metrics.checkout_wait_total_seconds / metrics.checkout_waits
+                    if metrics.checkout_waits
+                    else 0.0
+                ),
+                "checkout_wait_max_seconds": metrics.checkout_wait_max_seconds,
+                "connects": metrics.connects,
+                "invalidations": metrics.invalidations,
+            }
+        )
+    return result
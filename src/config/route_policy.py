@@ -0,0 +1,68 @@
+import re
+from enum import Enum
+
+from src.config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RoutePolicy(str, Enum):
+    PUBLIC = "public"  # No authentication
+    DOCS = "docs"  # API docs, protected by their own basic auth
+    BOT = "bot"  # Discord bot requests (Discord-Bot header), JWT otherwise
+    JWT = "jwt"  # Bearer access token (default)
+
+
+# path prefix -> policy, declared by each router
+route_policies: dict[str, RoutePolicy] = {}
+
+route_policy_pattern: re.Pattern | None = None
+route_policy_groups: dict[str, RoutePolicy] = {}
+
+
+def register_route_policy(path_prefix: str, policy: RoutePolicy):
+    """
+    Declare the auth policy of every path starting with path_prefix
+
+    The longest matching prefix wins, paths without a policy require a JWT.
+    """
+    global route_policy_pattern
+
+    previous = route_policies.get(path_prefix)
+    if previous and previous != policy:
+        logger.warning(
+            f"Route policy of {path_prefix} changed from {previous.value} to "
+            f"{policy.value}"
+        )
+    route_policies[path_prefix] = policy
+    route_policy_pattern = None  # Rebuilt on the next lookup
+
+
+def build_route_policies():
+    """
+    Compile the registered prefixes into a single regex (longest prefix first)
+    """
+    global route_policy_pattern, route_policy_groups
+
+    prefixes = sorted(route_policies, key=len, reverse=True)
+    route_policy_groups = {
+        f"p{index}": route_policies[prefix] for index, prefix in enumerate(prefixes)
+    }
+    alternatives = "|".join(
+        f"(?P<p{index}>{re.escape(prefix)})" for index, prefix in enumerate(prefixes)
+    )
+    route_policy_pattern = re.compile(f"(?:{alternatives})" if prefixes else "(?!)")
+    logger.info(f"Built {len(prefixes)} route policies")
+
+
+def get_route_policy(path: str) -> RoutePolicy:
+    """
+    Returns the policy of the longest registered prefix of the path
+    """
+    if route_policy_pattern is None:
+        build_route_policies()
+
+    match = route_policy_pattern.match(path)
+    if not match:
+        return RoutePolicy.JWT
+    return route_policy_groups[match.lastgroup]
@@ -1,19 +1,40 @@
+import asyncio
 import re
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
-import requests
 from sqlalchemy.orm import Session
 
-from src.common.util.github import get_github_headers
+from src.common.util.executor import run_blocking
+from src.common.util.github import aget_github_headers
+from src.common.util.github_client import (
+    GITHUB_URL,
+    github_get,
+    github_request,
+    paginate,
+    raise_github_api_error,
+)
+from src.config.config import (
+    ISSUE_MIRROR_MAX_AGE_SECONDS,
+    ISSUE_MIRROR_SINCE_SKEW_SECONDS,
+    ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS,
+)
+from src.config.logger_config import add_daily_file_handler, setup_logger
 from src.issue.schemas import IssueCloseReq, IssueCreateReq, IssueRes, IssueUpdateReq
+from src.models import ProjectIssue
+from src.project_issue import repository as project_issue_repository
 from src.response.error_definitions import (
     GitHubApiError,
     InvalidPriority,
     IssueNotFound,
+    SQLError,
 )
 from src.user.repository import find_all_users_by_github_names
 from src.user.schemas import UserRes
 
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
 
 def retrieve_hidden_metadata(body: str) -> Optional[Tuple[str, int]]:
     """
@@ -54,15 +75,9 @@ def add_hidden_metadata(body: str, priority: str, iteration: int) -> str:
         return f"{body.rstrip()}\n\n{new_metadata}"
 
 
-def return_issue_res(issue_json, db: Session):
-    if issue_json.get("pull_request") is not None:
-        return None
+def build_issue_res(issue_json, assignees: list[UserRes]) -> IssueRes:
     priority, iteration = retrieve_hidden_metadata(issue_json["body"])
 
-    github_names = [assignee["login"] for assignee in issue_json.get("assignees", [])]
-    users = find_all_users_by_github_names(db, github_names)
-    assignees = [UserRes.model_validate(user) for user in users]
-
     issue_res = IssueRes(
         repo_fullname=issue_json["repository_url"].split("repos/")[-1],
         issue_number=int(issue_json["number"]),
@@ -77,10 +92,241 @@ def return_issue_res(issue_json, db: Session):
     return issue_res
 
 
-def create_issue(
+def return_issue_res(issue_json, db: Session):
+    if issue_json.get("pull_request") is not None:
+        return None
+
+    github_names = [assignee["login"] for assignee in issue_json.get("assignees", [])]
+    users = find_all_users_by_github_names(db, github_names)
+    assignees = [UserRes.model_validate(user) for user in users]
+
+    return build_issue_res(issue_json, assignees)
+
+
+def return_issue_res_list(issue_json_list: list, db: Session) -> list[IssueRes]:
+    """
+    Map a listing of issues to IssueRes, resolving every assignee with one query
+    """
+    issue_json_list = [
+        issue_json
+        for issue_json in issue_json_list
+        if issue_json.get("pull_request") is None
+    ]
+
+    github_names = {
+        assignee["login"]
+        for issue_json in issue_json_list
+        for assignee in issue_json.get("assignees", [])
+    }
+    users_by_github_name = find_assignees_by_github_names(db, github_names)
+
+    return [
+        build_issue_res(
+            issue_json,
+            [
+                users_by_github_name[assignee["login"]]
+                for assignee in issue_json.get("assignees", [])
+                if assignee["login"] in users_by_github_name
+            ],
+        )
+        for issue_json in issue_json_list
+    ]
+
+
+def find_assignees_by_github_names(
+    db: Session, github_names: set[str]
+) -> dict[str, UserRes]:
+    """
+    Returns registered users of the given GitHub names keyed by GitHub name
+    """
+    if not github_names:
+        return {}
+    users = find_all_users_by_github_names(db, list(github_names))
+    return {user.github_name: UserRes.model_validate(user) for user in users}
+
+
+def to_project_issue(repo_fullname: str, issue_json) -> ProjectIssue:
+    """
+    Convert GitHub issue JSON to a row of the local issue mirror
+    """
+    body = issue_json.get("body") or ""
+    priority, iteration = retrieve_hidden_metadata(body)
+
+    return ProjectIssue(
+        repo_fullname=repo_fullname,
+        issue_number=int(issue_json["number"]),
+        title=issue_json["title"],
+        body=body,
+        closed=(issue_json["closed_at"] != None),
+        assignees=[assignee["login"] for assignee in issue_json.get("assignees", [])],
+        labels=[label["name"] for label in issue_json.get("labels", [])],
+        priority=priority,
+        iteration=iteration,
+        updated_at=parse_github_datetime(issue_json.get("updated_at")),
+    )
+
+
+def parse_github_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+def mirror_issue(repo_fullname: str, issue_json, db: Session):
+    """
+    Write the issue returned by GitHub to the local issue mirror
+
+    The change is already made on GitHub, so a failed write is only logged
+    (the next incremental sync fetches the issue again) instead of failing
+    the request and making clients retry it.
+    """
+    if issue_json.get("pull_request") is not None:
+        return
+    try:
+        project_issue_repository.upsert_project_issues(
+            db, repo_fullname, [to_project_issue(repo_fullname, issue_json)]
+        )
+    except SQLError:
+        logger.warning(
+            f"Failed to mirror issue {repo_fullname}#{issue_json.get('number')}"
+        )
+
+
+sync_locks: dict[str, asyncio.Lock] = {}
+
+
+async def sync_project_issues(
+    user_id: int,
+    repo_fullname: str,
+    db: Session,
+    max_age_seconds: int = ISSUE_MIRROR_MAX_AGE_SECONDS,
+):
+    """
+    Incrementally sync the local issue mirror from GitHub
+
+    Skipped while the last sync is younger than max_age_seconds, or
+    ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS while an `issues` webhook arrived
+    within that time. Otherwise only issues updated since the last sync are
+    fetched (`since=`, minus ISSUE_MIRROR_SINCE_SKEW_SECONDS). synced_at is not
+    moved when the upsert fails, so the next sync fetches the same issues again.
+    """
+    lock = sync_locks.setdefault(repo_fullname, asyncio.Lock())
+    async with lock:
+        issue_sync = await run_blocking(
+            project_issue_repository.find_project_issue_sync, db, repo_fullname
+        )
+        synced_at = issue_sync.synced_at if issue_sync else None
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        # Trust the mirror longer only while `issues` webhooks keep arriving
+        webhook_received_at = issue_sync.webhook_received_at if issue_sync else None
+        if (
+            webhook_received_at
+            and (now - webhook_received_at).total_seconds()
+            < ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS
+        ):
+            max_age_seconds = max(max_age_seconds, ISSUE_MIRROR_WEBHOOK_MAX_AGE_SECONDS)
+
+        if synced_at and (now - synced_at).total_seconds() < max_age_seconds:
+            return
+
+        params = {"state": "all"}
+        if synced_at:
+            since = synced_at - timedelta(seconds=ISSUE_MIRROR_SINCE_SKEW_SECONDS)
+            params["since"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues"
+        headers = await aget_github_headers(user_id, db)
+        project_issues = [
+            to_project_issue(repo_fullname, issue_json)
+            async for issue_json in paginate(repos_url, headers=headers, params=params)
+            if issue_json.get("pull_request") is None
+        ]
+
+        await run_blocking(
+            save_synced_project_issues, repo_fullname, project_issues, now, db
+        )
+
+
+def save_synced_project_issues(
+    repo_fullname: str,
+    project_issues: list[ProjectIssue],
+    synced_at: datetime,
+    db: Session,
+):
+    """
+    Upsert the fetched issues, then move synced_at (blocking)
+    """
+    project_issue_repository.upsert_project_issues(db, repo_fullname, project_issues)
+    project_issue_repository.save_project_issue_sync(
+        db, repo_fullname, synced_at=synced_at
+    )
+
+
+async def count_issues_by_state(
+    user_id: int, repo_fullname: str, db: Session
+) -> dict[bool, int]:
+    """
+    Count open/closed issues with GitHub search `total_count` (no issue bodies)
+
+    Returns {closed: count}
+    """
+    search_url = f"{GITHUB_URL}/search/issues"
+    headers = await aget_github_headers(user_id, db)
+
+    async def count(state: str) -> int:
+        response = await github_get(
+            search_url,
+            headers=headers,
+            params={"q": f"repo:{repo_fullname} is:issue state:{state}", "per_page": 1},
+        )
+        if response.status_code != 200:
+            raise_github_api_error(response)
+        return response.json()["total_count"]
+
+    opened, closed = await asyncio.gather(count("open"), count("closed"))
+    return {False: opened, True: closed}
+
+
+def find_all_mirrored_issues(repo_fullname: str, db: Session) -> list[IssueRes]:
+    """
+    Returns all issues of the repository from the local issue mirror
+    """
+    project_issues = project_issue_repository.find_all_project_issues_by_repo_fullname(
+        db, repo_fullname
+    )
+
+    github_names = {
+        github_name
+        for project_issue in project_issues
+        for github_name in project_issue.assignees or []
+    }
+    users_by_github_name = find_assignees_by_github_names(db, github_names)
+
+    return [
+        IssueRes(
+            repo_fullname=project_issue.repo_fullname,
+            issue_number=project_issue.issue_number,
+            title=project_issue.title,
+            body=project_issue.body,
+            assignees=[
+                users_by_github_name[github_name]
+                for github_name in project_issue.assignees or []
+                if github_name in users_by_github_name
+            ],
+            priority=project_issue.priority,
+            iteration=project_issue.iteration,
+            labels=project_issue.labels or [],
+            closed=project_issue.closed,
+        )
+        for project_issue in project_issues
+    ]
+
+
+async def create_issue(
     user_id: int, repo_fullname: str, issue_req: IssueCreateReq, db: Session
 ):
-    repos_url = f"https://api.github.com/repos/{repo_fullname}/issues"
+    repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues"
     req_data = {
         "title": issue_req.title,
         "body": add_hidden_metadata(
@@ -90,8 +336,8 @@ def create_issue(
         "labels": issue_req.labels,
     }
 
-    response = requests.post(
-        repos_url, headers=get_github_headers(user_id, db), json=req_data
+    response = await github_request(
+        "POST", repos_url, headers=await aget_github_headers(user_id, db), json=req_data
     )
 
     if response.status_code != 201:
@@ -102,14 +348,17 @@ def create_issue(
         raise GitHubApiError(response.status_code, detail=error_message)
 
     issue_json = response.json()
-    return return_issue_res(issue_json, db)
+    await run_blocking(mirror_issue, repo_fullname, issue_json, db)
+    return await run_blocking(return_issue_res, issue_json, db)
 
 
-def find_issue_by_issue_number(
+async def find_issue_by_issue_number(
     user_id: int, repo_fullname: str, issue_number: int, db: Session
 ):
-    repos_url = f"https://api.github.com/repos/{repo_fullname}/issues/{issue_number}"
-    response = requests.get(repos_url, headers=get_github_headers(user_id, db))
+    repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues/{issue_number}"
+    response = await github_get(
+        repos_url, headers=await aget_github_headers(user_id, db)
+    )
 
     if response.status_code != 200:
         try:
@@ -119,7 +368,7 @@ def find_issue_by_issue_number(
         raise GitHubApiError(response.status_code, detail=error_message)
 
     issue_json = response.json()
-    issue_data = return_issue_res(issue_json, db)
+    issue_data = await run_blocking(return_issue_res, issue_json, db)
 
     if not issue_data:
         raise IssueNotFound()
@@ -127,30 +376,22 @@ def find_issue_by_issue_number(
     return issue_data
 
 
-def find_all_issues_by_project_id(user_id: int, repo_fullname: str, db: Session):
-    repos_url = f"https://api.github.com/repos/{repo_fullname}/issues?state=all"
-    response = requests.get(repos_url, headers=get_github_headers(user_id, db))
-    if response.status_code != 200:
-        try:
-            error_message = response.json().get("message", "")
-        except Exception:
-            error_message = response.text or "No error message provided"
-        raise GitHubApiError(response.status_code, detail=error_message)
-
-    issue_list_json = response.json()
-    return [
-        return_issue_res(issue_json, db)
-        for issue_json in issue_list_json
-        if return_issue_res(issue_json, db) is not None
-    ]
+async def find_all_issues_by_project_id(user_id: int, repo_fullname: str, db: Session):
+    repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues"
+    issue_list_json = paginate(
+        repos_url,
+        headers=await aget_github_headers(user_id, db),
+        params={"state": "all"},
+    )
+    return await run_blocking(
+        return_issue_res_list, [issue_json async for issue_json in issue_list_json], db
+    )
 
 
-def update_issue(
+async def update_issue(
     user_id: int, repo_fullname: str, issue_req: IssueUpdateReq, db: Session
 ):
-    repos_url = (
-        f"https://api.github.com/repos/{repo_fullname}/issues/{issue_req.issue_number}"
-    )
+    repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues/{issue_req.issue_number}"
     req_data = {
         "title": issue_req.title,
         "body": add_hidden_metadata(
@@ -160,8 +401,11 @@ def update_issue(
         "labels": issue_req.labels,
     }
 
-    response = requests.patch(
-        repos_url, headers=get_github_headers(user_id, db), json=req_data
+    response = await github_request(
+        "PATCH",
+        repos_url,
+        headers=await aget_github_headers(user_id, db),
+        json=req_data,
     )
 
     if response.status_code != 200:
@@ -172,19 +416,21 @@ def update_issue(
         raise GitHubApiError(response.status_code, detail=error_message)
 
     issue_json = response.json()
-    return return_issue_res(issue_json, db)
+    await run_blocking(mirror_issue, repo_fullname, issue_json, db)
+    return await run_blocking(return_issue_res, issue_json, db)
 
 
-def close_issue(
+async def close_issue(
     user_id: int, repo_fullname: str, issue_req: IssueCloseReq, db: Session
 ):
-    repos_url = (
-        f"https://api.github.com/repos/{repo_fullname}/issues/{issue_req.issue_number}"
-    )
+    repos_url = f"{GITHUB_URL}/repos/{repo_fullname}/issues/{issue_req.issue_number}"
     req_data = {"state": "close"}
 
-    response = requests.patch(
-        repos_url, headers=get_github_headers(user_id, db), json=req_data
+    response = await github_request(
+        "PATCH",
+        repos_url,
+        headers=await aget_github_headers(user_id, db),
+        json=req_data,
     )
 
     if response.status_code != 200:
@@ -193,3 +439,5 @@ def close_issue(
         except Exception:
             error_message = response.text or "No error message provided"
         raise GitHubApiError(response.status_code, detail=error_message)
+
+    await run_blocking(mirror_issue, repo_fullname, response.json(), db)
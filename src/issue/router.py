@@ -1,8 +1,10 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.config.async_database import get_async_db
 from src.config.database import get_db
 from src.issue import service
 from src.issue.schemas import (
@@ -24,11 +26,14 @@ router = APIRouter(prefix="/issue", tags=["Issue"])
 
 
 @router.post("", summary="Create a new issue", response_model=SuccessResponse[IssueRes])
-def create_issue(
-    request: Request, issue_req: IssueCreateReq, db: Session = Depends(get_db)
+async def create_issue(
+    request: Request,
+    issue_req: IssueCreateReq,
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    data = service.create_issue(user_id, issue_req, db)
+    data = await service.create_issue(user_id, issue_req, db, async_db)
     return issue_create_success(data)
 
 
@@ -37,14 +42,15 @@ def create_issue(
     summary="Get existing issue",
     response_model=SuccessResponse[IssueRes],
 )
-def get_issue(
+async def get_issue(
     request: Request,
     project_id: int,
     issue_number: int,
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    data = service.get_issue(user_id, project_id, issue_number, db)
+    data = await service.get_issue(user_id, project_id, issue_number, db, async_db)
     return issue_read_success(data)
 
 
@@ -53,13 +59,17 @@ def get_issue(
     summary="Get issue summary of project",
     response_model=SuccessResponse[ProjectIssueSummary],
 )
-def get_project_issue_summary(
+async def get_project_issue_summary(
     request: Request,
     project_id: int,
+    breakdown: bool = False,
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    data = service.get_project_issue_summary(user_id, project_id, db)
+    data = await service.get_project_issue_summary(
+        user_id, project_id, db, async_db, breakdown
+    )
     return issue_read_success(data)
 
 
@@ -68,31 +78,38 @@ def get_project_issue_summary(
     summary="Get all existing issues",
     response_model=SuccessResponse[List[IssueRes]],
 )
-def get_all_issues(
+async def get_all_issues(
     request: Request,
     project_id: int,
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    data = service.get_all_issues(user_id, project_id, db)
+    data = await service.get_all_issues(user_id, project_id, db, async_db)
     return issue_read_success(data)
 
 
 @router.put(
     "", summary="Update the existing issue", response_model=SuccessResponse[IssueRes]
 )
-def update_issue(
-    request: Request, issue_req: IssueUpdateReq, db: Session = Depends(get_db)
+async def update_issue(
+    request: Request,
+    issue_req: IssueUpdateReq,
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    data = service.update_issue(user_id, issue_req, db)
+    data = await service.update_issue(user_id, issue_req, db, async_db)
     return issue_update_success(data)
 
 
 @router.patch("", summary="Close the existing issue", response_model=SuccessResponse)
-def close_issue(
-    request: Request, issue_req: IssueCloseReq, db: Session = Depends(get_db)
+async def close_issue(
+    request: Request,
+    issue_req: IssueCloseReq,
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
 ):
     user_id = request.state.user_id
-    service.close_issue(user_id, issue_req, db)
+    await service.close_issue(user_id, issue_req, db, async_db)
     return issue_close_success()
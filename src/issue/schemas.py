@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -43,7 +43,15 @@ class IssueRes(BaseModel):
     closed: bool
 
 
+class IssueCount(BaseModel):
+    opened_issues: int = 0
+    closed_issues: int = 0
+    all_issues: int = 0
+
+
 class ProjectIssueSummary(BaseModel):
     opened_issues: int
     closed_issues: int
     all_issues: int
+    priorities: Optional[Dict[str, IssueCount]] = None
+    iterations: Optional[Dict[int, IssueCount]] = None
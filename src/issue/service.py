@@ -1,122 +1,190 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.common.util.executor import run_blocking
 from src.common.util.github import check_github_repo_exists
+from src.config.config import ISSUE_MIRROR_ENABLED
 from src.issue import repository
 from src.issue.schemas import (
     IssueCloseReq,
+    IssueCount,
     IssueCreateReq,
     IssueUpdateReq,
     ProjectIssueSummary,
 )
-from src.project.repository import find_project_by_id
+from src.project.async_repository import find_project_by_id
+from src.project_issue import repository as project_issue_repository
 from src.response.error_definitions import RepositoryNotFoundInGitHub
 
 
-def create_issue(user_id: int, issue_req: IssueCreateReq, db: Session):
+async def create_issue(
+    user_id: int, issue_req: IssueCreateReq, db: Session, async_db: AsyncSession
+):
     """
     Create a new issue in GitHub
 
     Returns issue data
     """
-    project = find_project_by_id(db, issue_req.project_id)
+    project = await find_project_by_id(async_db, issue_req.project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    return repository.create_issue(user_id, project.repo_fullname, issue_req, db)
+    return await repository.create_issue(user_id, project.repo_fullname, issue_req, db)
 
 
-def get_issue(user_id: int, project_id: int, issue_number: int, db: Session):
+async def get_issue(
+    user_id: int,
+    project_id: int,
+    issue_number: int,
+    db: Session,
+    async_db: AsyncSession,
+):
     """
     Get the existing issue by issue number from GitHub
 
     Returns issue data
     """
-    project = find_project_by_id(db, project_id)
+    project = await find_project_by_id(async_db, project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    return repository.find_issue_by_issue_number(
+    return await repository.find_issue_by_issue_number(
         user_id, project.repo_fullname, issue_number, db
     )
 
 
-def get_project_issue_summary(
-    user_id: int, project_id: int, db: Session
+def build_issue_summary(
+    counts: list[tuple[bool, str, int, int]], breakdown: bool
+) -> ProjectIssueSummary:
+    """
+    Build summary from (closed, priority, iteration, count) rows
+    """
+    total = IssueCount()
+    priorities: dict[str, IssueCount] = {}
+    iterations: dict[int, IssueCount] = {}
+
+    for closed, priority, iteration, count in counts:
+        targets = [total]
+        if breakdown:
+            targets.append(priorities.setdefault(priority, IssueCount()))
+            targets.append(iterations.setdefault(iteration, IssueCount()))
+
+        for target in targets:
+            if closed:
+                target.closed_issues += count
+            else:
+                target.opened_issues += count
+            target.all_issues += count
+
+    return ProjectIssueSummary(
+        opened_issues=total.opened_issues,
+        closed_issues=total.closed_issues,
+        all_issues=total.all_issues,
+        priorities=priorities if breakdown else None,
+        iterations=iterations if breakdown else None,
+    )
+
+
+async def get_project_issue_summary(
+    user_id: int,
+    project_id: int,
+    db: Session,
+    async_db: AsyncSession,
+    breakdown: bool = False,
 ) -> ProjectIssueSummary:
     """
     Get summary of project issues (number of opend/closed/all issues)
+
+    With breakdown, also returns the counts per priority and per iteration
     """
-    project = find_project_by_id(db, project_id)
+    project = await find_project_by_id(async_db, project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    all_issues = repository.find_all_issues_by_project_id(
+    if ISSUE_MIRROR_ENABLED:
+        await repository.sync_project_issues(user_id, project.repo_fullname, db)
+        counts = await run_blocking(
+            project_issue_repository.count_project_issues, db, project.repo_fullname
+        )
+        return build_issue_summary(counts, breakdown)
+
+    if not breakdown:
+        # Only total_count of GitHub search, without downloading issues
+        state_counts = await repository.count_issues_by_state(
+            user_id, project.repo_fullname, db
+        )
+        counts = [(closed, "U", -1, count) for closed, count in state_counts.items()]
+        return build_issue_summary(counts, breakdown)
+
+    all_issues = await repository.find_all_issues_by_project_id(
         user_id, project.repo_fullname, db
     )
+    counts = [
+        (issue.closed, issue.priority, issue.iteration, 1) for issue in all_issues
+    ]
+    return build_issue_summary(counts, breakdown)
 
-    opened_issues = 0
-    closed_issues = 0
 
-    for issue in all_issues:
-        if issue.closed:
-            closed_issues += 1
-        else:
-            opened_issues += 1
-
-    summary = ProjectIssueSummary(
-        opened_issues=opened_issues,
-        closed_issues=closed_issues,
-        all_issues=opened_issues + closed_issues,
-    )
-    return summary
-
-
-def get_all_issues(user_id: int, project_id: int, db: Session):
+async def get_all_issues(
+    user_id: int, project_id: int, db: Session, async_db: AsyncSession
+):
     """
     Get all existing issues in project
 
     Returns list of issue data
     """
-    project = find_project_by_id(db, project_id)
+    project = await find_project_by_id(async_db, project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    return repository.find_all_issues_by_project_id(user_id, project.repo_fullname, db)
+    if ISSUE_MIRROR_ENABLED:
+        await repository.sync_project_issues(user_id, project.repo_fullname, db)
+        return await run_blocking(
+            repository.find_all_mirrored_issues, project.repo_fullname, db
+        )
+
+    return await repository.find_all_issues_by_project_id(
+        user_id, project.repo_fullname, db
+    )
 
 
-def update_issue(user_id: int, issue_req: IssueUpdateReq, db: Session):
+async def update_issue(
+    user_id: int, issue_req: IssueUpdateReq, db: Session, async_db: AsyncSession
+):
     """
     Update the existing issue by issue number in GitHub
 
     Returns issue data
     """
-    project = find_project_by_id(db, issue_req.project_id)
+    project = await find_project_by_id(async_db, issue_req.project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    return repository.update_issue(user_id, project.repo_fullname, issue_req, db)
+    return await repository.update_issue(user_id, project.repo_fullname, issue_req, db)
 
 
-def close_issue(user_id: int, issue_req: IssueCloseReq, db: Session):
+async def close_issue(
+    user_id: int, issue_req: IssueCloseReq, db: Session, async_db: AsyncSession
+):
     """
     Close the existing issue by issue number in GitHub
 
     Returns issue data
     """
-    project = find_project_by_id(db, issue_req.project_id)
+    project = await find_project_by_id(async_db, issue_req.project_id)
 
-    is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
-    repository.close_issue(user_id, project.repo_fullname, issue_req, db)
+    await repository.close_issue(user_id, project.repo_fullname, issue_req, db)
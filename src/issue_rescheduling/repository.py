@@ -3,6 +3,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import NoResultFound
 
+from src.common.util.executor import run_blocking
 from src.config.logger_config import add_daily_file_handler, setup_logger
 from src.issue.repository import update_issue
 from src.issue.schemas import IssueUpdateReq
@@ -92,20 +93,25 @@ def update_issue_rescheduling(
         raise SQLError()
 
 
-def delete_issue_rescheduling(
+async def delete_issue_rescheduling(
     db: Session,
     user_id: int,
     issue_rescheduling: IssueRescheduling,
     issue_update_req: IssueUpdateReq | None,
 ):
+    if issue_update_req:
+        # project is already loaded by the permission check
+        await update_issue(
+            user_id,
+            issue_rescheduling.project.repo_fullname,
+            issue_update_req,
+            db,
+        )
+    await run_blocking(remove_issue_rescheduling, db, issue_rescheduling)
+
+
+def remove_issue_rescheduling(db: Session, issue_rescheduling: IssueRescheduling):
     try:
-        if issue_update_req:
-            update_issue(
-                user_id,
-                issue_rescheduling.project.repo_fullname,
-                issue_update_req,
-                db,
-            )
         db.delete(issue_rescheduling)
         db.commit()
     except SQLAlchemyError as e:
@@ -26,14 +26,14 @@ router = APIRouter(prefix="/issue-reschedule", tags=["Issue Rescheduling"])
     summary="Create a new issue rescheduling",
     response_model=SuccessResponse[IssueReschedulingRes],
 )
-def create_issue_rescheduling(
+async def create_issue_rescheduling(
     request: Request,
     project_id: int,
     issue_rescheduling_req: IssueReschedulingReq,
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    data = service.create_issue_rescheduling(
+    data = await service.create_issue_rescheduling(
         user_id, project_id, issue_rescheduling_req, db
     )
     return issue_rescheduling_create_success(data)
@@ -44,13 +44,13 @@ def create_issue_rescheduling(
     summary="Get all existing issue reschedulings",
     response_model=SuccessResponse[List[IssueReschedulingRes]],
 )
-def get_all_issue_reschedulings(
+async def get_all_issue_reschedulings(
     request: Request,
     project_id: int,
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    data = service.get_all_issue_reschedulings(user_id, project_id, db)
+    data = await service.get_all_issue_reschedulings(user_id, project_id, db)
     return issue_rescheduling_read_success(data)
 
 
@@ -59,14 +59,14 @@ def get_all_issue_reschedulings(
     summary="Update the existing issue rescheduling",
     response_model=SuccessResponse[IssueReschedulingRes],
 )
-def update_issue_rescheduling(
+async def update_issue_rescheduling(
     request: Request,
     project_id: int,
     issue_rescheduling_req: IssueReschedulingReq,
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    data = service.update_issue_rescheduling(
+    data = await service.update_issue_rescheduling(
         user_id, project_id, issue_rescheduling_req, db
     )
     return issue_rescheduling_update_success(data)
@@ -77,14 +77,14 @@ def update_issue_rescheduling(
     summary="Approve or Disapprove the existing issue rescheduling",
     response_model=SuccessResponse,
 )
-def delete_issue_rescheduling(
+async def delete_issue_rescheduling(
     request: Request,
     id: int,
     type: IssueReschedulingType,
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    service.delete_issue_rescheduling(user_id, id, type, db)
+    await service.delete_issue_rescheduling(user_id, id, type, db)
     if type == IssueReschedulingType.APPROVED:
         return issue_rescheduling_delete_success("승인")
     elif type == IssueReschedulingType.REJECTED:
@@ -1,5 +1,8 @@
+from typing import List
+
 from sqlalchemy.orm import Session
 
+from src.common.util.executor import run_blocking
 from src.common.util.permissions import (
     has_permission_to_access_project,
     has_permission_to_modify_issue_rescheduling,
@@ -14,6 +17,7 @@ from src.issue_rescheduling.schemas import (
     IssueReschedulingType,
 )
 from src.project import repository as project_repository
+from src.project.models import Project
 from src.response.error_definitions import (
     InvalidReschedulingType,
     IssueNotFound,
@@ -22,16 +26,18 @@ from src.response.error_definitions import (
     UserNotFound,
 )
 from src.user import repository as user_repository
+from src.user.models import User
 
 
-def create_issue_rescheduling(
+def check_new_issue_rescheduling(
     user_id: int,
     project_id: int,
     issue_rescheduling_req: IssueReschedulingReq,
     db: Session,
-):
+) -> tuple[User, Project]:
     """
-    Create a new issue rescheduling
+    Returns the requester and the project if the rescheduling can be created
+    (blocking)
     """
     has_permission_to_access_project(user_id, project_id, db)
 
@@ -45,9 +51,23 @@ def create_issue_rescheduling(
     if existing_issue_rescheduling:
         raise IssueReschedulingAlreadyExist()
 
-    project = project_repository.find_project_by_id(db, project_id)
+    return requester, project_repository.find_project_by_id(db, project_id)
+
 
-    issue = issue_repository.find_issue_by_issue_number(
+async def create_issue_rescheduling(
+    user_id: int,
+    project_id: int,
+    issue_rescheduling_req: IssueReschedulingReq,
+    db: Session,
+):
+    """
+    Create a new issue rescheduling
+    """
+    requester, project = await run_blocking(
+        check_new_issue_rescheduling, user_id, project_id, issue_rescheduling_req, db
+    )
+
+    issue = await issue_repository.find_issue_by_issue_number(
         user_id, project.repo_fullname, issue_rescheduling_req.issue_number, db
     )
     if not issue:
@@ -62,8 +82,8 @@ def create_issue_rescheduling(
         project_id=project_id,
     )
 
-    saved_issue_rescheduling = issue_rescheduling_repository.create_issue_rescheduling(
-        db, issue_rescheduling
+    saved_issue_rescheduling = await run_blocking(
+        issue_rescheduling_repository.create_issue_rescheduling, db, issue_rescheduling
     )
     issue_rescheduling_res = IssueReschedulingRes.from_issue(
         saved_issue_rescheduling, requester, issue
@@ -72,7 +92,12 @@ def create_issue_rescheduling(
     return issue_rescheduling_res
 
 
-def get_all_issue_reschedulings(user_id: int, project_id: int, db: Session):
+def find_all_issue_reschedulings(
+    user_id: int, project_id: int, db: Session
+) -> tuple[List[IssueRescheduling], Project]:
+    """
+    Returns the project's issue reschedulings and the project (blocking)
+    """
     all_existing_issue_reschedulings = (
         issue_rescheduling_repository.find_all_issue_rescheduling_by_project_id(
             db, project_id
@@ -81,17 +106,24 @@ def get_all_issue_reschedulings(user_id: int, project_id: int, db: Session):
     has_permission_to_access_project(user_id, project_id, db)
 
     project = project_repository.find_project_by_id(db, project_id)
+    return all_existing_issue_reschedulings, project
+
+
+async def get_all_issue_reschedulings(user_id: int, project_id: int, db: Session):
+    all_existing_issue_reschedulings, project = await run_blocking(
+        find_all_issue_reschedulings, user_id, project_id, db
+    )
 
     issue_rescheduling_res_list = []
     for issue_rescheduling in all_existing_issue_reschedulings:
-        issue = issue_repository.find_issue_by_issue_number(
+        issue = await issue_repository.find_issue_by_issue_number(
             user_id, project.repo_fullname, issue_rescheduling.issue_number, db
         )
         if not issue:
             raise IssueNotFound()
 
-        requester = user_repository.find_user_by_user_id(
-            db, issue_rescheduling.requester
+        requester = await run_blocking(
+            user_repository.find_user_by_user_id, db, issue_rescheduling.requester
         )
         if not requester:
             continue
@@ -104,17 +136,15 @@ def get_all_issue_reschedulings(user_id: int, project_id: int, db: Session):
     return issue_rescheduling_res_list
 
 
-def update_issue_rescheduling(
-    user_id: int,
-    project_id: int,
-    issue_rescheduling_req: IssueReschedulingReq,
-    db: Session,
-):
+def find_modifiable_issue_rescheduling(
+    user_id: int, project_id: int, issue_number: int, db: Session
+) -> tuple[IssueRescheduling, Project]:
     """
-    Update the existing issue rescheduling by project id and issue number
+    Returns the issue rescheduling after checking the user may modify it, and
+    its project (blocking)
     """
     existing_issue_rescheduling = issue_rescheduling_repository.find_issue_scheduling_by_project_id_and_issue_number(
-        db, project_id, issue_rescheduling_req.issue_number
+        db, project_id, issue_number
     )
     if not existing_issue_rescheduling:
         raise IssueReschedulingNotFound()
@@ -123,14 +153,19 @@ def update_issue_rescheduling(
         user_id, existing_issue_rescheduling, db
     )
 
-    project = project_repository.find_project_by_id(db, project_id)
-
-    issue = issue_repository.find_issue_by_issue_number(
-        user_id, project.repo_fullname, issue_rescheduling_req.issue_number, db
+    return existing_issue_rescheduling, project_repository.find_project_by_id(
+        db, project_id
     )
-    if not issue:
-        raise IssueNotFound()
 
+
+def save_issue_rescheduling_update(
+    existing_issue_rescheduling: IssueRescheduling,
+    issue_rescheduling_req: IssueReschedulingReq,
+    db: Session,
+) -> tuple[IssueRescheduling, User]:
+    """
+    Save the update and returns it with the requester (blocking)
+    """
     existing_issue_rescheduling.reason = issue_rescheduling_req.reason
     existing_issue_rescheduling.new_iteration = issue_rescheduling_req.new_iteration
     existing_issue_rescheduling.new_assignees = issue_rescheduling_req.new_assignees
@@ -144,6 +179,38 @@ def update_issue_rescheduling(
     )
     if not requester:
         raise UserNotFound()
+    return saved_issue_rescheduling, requester
+
+
+async def update_issue_rescheduling(
+    user_id: int,
+    project_id: int,
+    issue_rescheduling_req: IssueReschedulingReq,
+    db: Session,
+):
+    """
+    Update the existing issue rescheduling by project id and issue number
+    """
+    existing_issue_rescheduling, project = await run_blocking(
+        find_modifiable_issue_rescheduling,
+        user_id,
+        project_id,
+        issue_rescheduling_req.issue_number,
+        db,
+    )
+
+    issue = await issue_repository.find_issue_by_issue_number(
+        user_id, project.repo_fullname, issue_rescheduling_req.issue_number, db
+    )
+    if not issue:
+        raise IssueNotFound()
+
+    saved_issue_rescheduling, requester = await run_blocking(
+        save_issue_rescheduling_update,
+        existing_issue_rescheduling,
+        issue_rescheduling_req,
+        db,
+    )
 
     issue_rescheduling_res = IssueReschedulingRes.from_issue(
         saved_issue_rescheduling, requester, issue
@@ -151,9 +218,13 @@ def update_issue_rescheduling(
     return issue_rescheduling_res
 
 
-def delete_issue_rescheduling(
-    user_id: int, id: int, type: IssueReschedulingType, db: Session
-):
+def find_deletable_issue_rescheduling(
+    user_id: int, id: int, db: Session
+) -> tuple[IssueRescheduling, str]:
+    """
+    Returns the issue rescheduling after checking the user may modify it, and
+    its repository (blocking)
+    """
     existing_issue_rescheduling = (
         issue_rescheduling_repository.find_issue_scheduling_by_id(db, id)
     )
@@ -163,11 +234,23 @@ def delete_issue_rescheduling(
     has_permission_to_modify_issue_rescheduling(
         user_id, existing_issue_rescheduling, db
     )
+    return (
+        existing_issue_rescheduling,
+        existing_issue_rescheduling.project.repo_fullname,
+    )
+
+
+async def delete_issue_rescheduling(
+    user_id: int, id: int, type: IssueReschedulingType, db: Session
+):
+    existing_issue_rescheduling, repo_fullname = await run_blocking(
+        find_deletable_issue_rescheduling, user_id, id, db
+    )
 
     if type == IssueReschedulingType.APPROVED:
-        issue = issue_repository.find_issue_by_issue_number(
+        issue = await issue_repository.find_issue_by_issue_number(
             user_id,
-            existing_issue_rescheduling.project.repo_fullname,
+            repo_fullname,
             existing_issue_rescheduling.issue_number,
             db,
         )
@@ -183,11 +266,11 @@ def delete_issue_rescheduling(
             labels=issue.labels,
         )
 
-        issue_rescheduling_repository.delete_issue_rescheduling(
+        await issue_rescheduling_repository.delete_issue_rescheduling(
             db, user_id, existing_issue_rescheduling, issue_update_req
         )
     elif type == IssueReschedulingType.REJECTED:
-        issue_rescheduling_repository.delete_issue_rescheduling(
+        await issue_rescheduling_repository.delete_issue_rescheduling(
             db, user_id, existing_issue_rescheduling, None
         )
     else:
@@ -9,27 +9,45 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
 import src.models  # noqa: F401
 from agent.router import router as agent_router
+from agent.runtime import start_agent_warm_up, stop_agent_warm_up
 from auth.router import router as auth_router
 from bot.router import router as bot_router
 from issue.router import router as issue_router
 from issue_rescheduling.router import router as issue_rescheduling_router
+from metrics.router import router as metrics_router
 from project.router import router as project_router
 from src.bot.util import shutdown_scheduler, start_scheduler
+from src.common.util.executor import (
+    shutdown_blocking_executor,
+    start_loop_lag_monitor,
+    stop_loop_lag_monitor,
+)
+from src.common.util.github_client import close_github_client, init_github_client
 from src.config import volume_config
+from src.config.async_database import dispose_async_engine
 from src.config.config import (
+    AGENT_ENDPOINTS_ENABLED,
+    AGENT_WARM_UP,
     DISCORD_CHANNEL_ID,
     FRONTEND_URL,
     IS_LOCAL,
     SWAGGER_PASSWORD,
     SWAGGER_USERNAME,
 )
-from src.config.database import initialize_database
+from src.config.database import create_missing_tables, initialize_database
 from src.config.logger_config import setup_logger
 from src.config.middleware import JWTAuthenticationMiddleware
+from src.config.route_policy import (
+    RoutePolicy,
+    build_route_policies,
+    register_route_policy,
+)
 from src.response.error_definitions import BaseAppException
 from src.response.handler import base_app_exception_handler, global_exception_handler
+from src.response.report_error import start_error_reporter, stop_error_reporter
 from user.router import router as user_router
 from user_repository.router import router as user_repository_router
+from webhook.router import router as webhook_router
 
 logger = setup_logger(__name__)
 
@@ -67,14 +85,27 @@ async def lifespan(app: FastAPI):
     if IS_LOCAL:
         initialize_database()
         volume_config.clear_design_docs()
+    else:
+        create_missing_tables()
+    init_github_client()
+    start_loop_lag_monitor()
+    start_error_reporter()
     await send_server_info("start")
     start_scheduler()
+    if AGENT_ENDPOINTS_ENABLED and AGENT_WARM_UP:
+        start_agent_warm_up()
 
     yield
 
     # When server stopped
     await send_server_info("stop")
     shutdown_scheduler()
+    await close_github_client()
+    await dispose_async_engine()
+    stop_loop_lag_monitor()
+    stop_agent_warm_up()
+    await stop_error_reporter()
+    shutdown_blocking_executor()
 
 
 app = FastAPI(
@@ -113,6 +144,10 @@ def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
     return True
 
 
+register_route_policy("/docs", RoutePolicy.DOCS)
+register_route_policy("/openapi.json", RoutePolicy.DOCS)
+
+
 @app.get("/docs", include_in_schema=False)
 async def get_documentation(
     credentials: HTTPBasicCredentials = Depends(verify_credentials),
@@ -124,8 +159,14 @@ async def get_documentation(
 app.include_router(auth_router)
 app.include_router(project_router)
 app.include_router(user_router)
-app.include_router(agent_router)
+if AGENT_ENDPOINTS_ENABLED:
+    app.include_router(agent_router)
 app.include_router(issue_router)
 app.include_router(user_repository_router)
 app.include_router(issue_rescheduling_router)
 app.include_router(bot_router)
+app.include_router(webhook_router)
+app.include_router(metrics_router)
+
+# Every router declared its policy on import
+build_route_policies()
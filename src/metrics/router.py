@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+
+from src.common.util.github_rate_limit import get_github_budgets
+from src.config.pool_metrics import get_pool_metrics
+from src.metrics.schemas import DatabasePoolRes, GitHubBudgetRes
+from src.response.schemas import SuccessResponse
+from src.response.success_definitions import (
+    database_pool_read_success,
+    github_budget_read_success,
+)
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "/github",
+    summary="Get GitHub rate limit budgets of this worker",
+    response_model=SuccessResponse,
+)
+async def get_github_budget_metrics():
+    data = [GitHubBudgetRes(**budget) for budget in get_github_budgets()]
+    return github_budget_read_success(data)
+
+
+@router.get(
+    "/db-pool",
+    summary="Get database connection pool status of this worker",
+    response_model=SuccessResponse,
+)
+async def get_database_pool_metrics():
+    data = [DatabasePoolRes(**metrics) for metrics in get_pool_metrics()]
+    return database_pool_read_success(data)
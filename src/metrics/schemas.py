@@ -0,0 +1,28 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class GitHubBudgetRes(BaseModel):
+    scope: str
+    resource: str
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_in_seconds: int
+    blocked_for_seconds: int
+    waiting: int
+
+
+class DatabasePoolRes(BaseModel):
+    engine: str
+    pool: Optional[str] = None
+    size: Optional[int] = None
+    in_use: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_avg_seconds: float
+    checkout_wait_max_seconds: float
+    connects: int
+    invalidations: int
@@ -1,7 +1,18 @@
 from src.issue_rescheduling.models import IssueRescheduling
 from src.project.models import Project
+from src.project_issue.models import ProjectIssue, ProjectIssueSync
 from src.project_user.models import ProjectUser
 from src.user.models import User
+from src.user_activity.models import UserActivity
 from src.user_repository.models import UserRepository
 
-__all__ = ["User", "Project", "ProjectUser", "UserRepository", "IssueRescheduling"]
+__all__ = [
+    "User",
+    "Project",
+    "ProjectUser",
+    "UserRepository",
+    "IssueRescheduling",
+    "ProjectIssue",
+    "ProjectIssueSync",
+    "UserActivity",
+]
@@ -0,0 +1,67 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.models import Project, ProjectUser
+from src.response.error_definitions import SQLError
+
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
+
+# Lazy loading is not available on AsyncSession, so members (and their users,
+# for ProjectRes) are loaded eagerly
+def select_project():
+    return select(Project).options(
+        selectinload(Project.members).selectinload(ProjectUser.user)
+    )
+
+
+async def find_project_by_id(db: AsyncSession, project_id: int) -> Project | None:
+    try:
+        result = await db.execute(select_project().filter(Project.id == project_id))
+        return result.scalars().first()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        await db.rollback()
+        raise SQLError()
+
+
+async def find_project_by_owner(db: AsyncSession, owner: int) -> list[Project]:
+    try:
+        result = await db.execute(select_project().filter(Project.owner == owner))
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        await db.rollback()
+        raise SQLError()
+
+
+async def is_project_member(db: AsyncSession, project_id: int, user_id: int) -> bool:
+    try:
+        result = await db.execute(
+            select(ProjectUser).filter(
+                ProjectUser.project_id == project_id, ProjectUser.user_id == user_id
+            )
+        )
+        return result.scalars().first() is not None
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        await db.rollback()
+        raise SQLError()
+
+
+async def find_projects_by_member(db: AsyncSession, user_id: int) -> list[Project]:
+    try:
+        result = await db.execute(
+            select_project()
+            .join(Project.members)
+            .filter(ProjectUser.user_id == user_id)
+        )
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during member projects retrieval: {e}")
+        await db.rollback()
+        raise SQLError()
@@ -3,9 +3,11 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from project import service as project_service
+from src.config.async_database import get_async_db
 from src.config.database import get_db
 from src.project.schemas import ProjectListRes, ProjectReq, ProjectRes
 from src.response.error_definitions import InvalidJsonDataFormat, InvalidJsonFormat
@@ -50,7 +52,7 @@ async def create_project(
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    data = project_service.create_project(
+    data = await project_service.create_project(
         user_id, parse_project_req_str(project_req), db, files
     )
     return project_create_success(data)
@@ -61,9 +63,13 @@ async def create_project(
     summary="Get all projects that user owns or participates in",
     response_model=SuccessResponse[List[ProjectListRes]],
 )
-def get_all_project(request: Request, db: Session = Depends(get_db)):
+async def get_all_project(
+    request: Request,
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
+):
     user_id = request.state.user_id
-    data = project_service.get_all_projects(user_id, db)
+    data = await project_service.get_all_projects(user_id, db, async_db)
     return project_read_success(data)
 
 
@@ -72,9 +78,14 @@ def get_all_project(request: Request, db: Session = Depends(get_db)):
     summary="Get existing project",
     response_model=SuccessResponse[ProjectRes],
 )
-def get_project(request: Request, project_id: int, db: Session = Depends(get_db)):
+async def get_project(
+    request: Request,
+    project_id: int,
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
+):
     user_id = request.state.user_id
-    data = project_service.get_project(user_id, project_id, db)
+    data = await project_service.get_project(user_id, project_id, db, async_db)
     return project_read_success(data)
 
 
@@ -83,7 +94,7 @@ def get_project(request: Request, project_id: int, db: Session = Depends(get_db)
     summary="Update existing project",
     response_model=SuccessResponse[ProjectRes],
 )
-def update_project(
+async def update_project(
     request: Request,
     project_id: int,
     project_req: str = Form(...),
@@ -91,7 +102,7 @@ def update_project(
     db: Session = Depends(get_db),
 ):
     user_id = request.state.user_id
-    data = project_service.update_project(
+    data = await project_service.update_project(
         user_id, project_id, parse_project_req_str(project_req), files, db
     )
     return project_update_success(data)
@@ -3,28 +3,32 @@ import shutil
 from typing import List, Optional
 
 from fastapi import File, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from project.schemas import ProjectListRes, ProjectReq, ProjectRes
-from src.common.util.github import check_github_repo_exists
-from src.common.util.permissions import (
-    has_permission_to_access_project,
-    has_permission_to_modify_project,
+from src.common.util.executor import run_blocking
+from src.common.util.github import (
+    check_github_repo_exists,
+    invalidate_github_repo_exists,
 )
+from src.common.util.permissions import has_permission_to_modify_project
 from src.models import Project, ProjectUser
+from src.project import async_repository as project_async_repository
 from src.project import repository as project_repository
-from src.project_user import repository as project_user_repository
 from src.response.error_definitions import (
     FileDeleteError,
     ProjectAlreadyExist,
     ProjectNotFound,
+    ProjectPermissionDenied,
     RepositoryNotFoundInGitHub,
     UserNotFound,
 )
+from src.user import async_repository as user_async_repository
 from src.user.repository import find_user_by_user_id
 
 
-def create_project(
+async def create_project(
     user_id: int,
     project_req: ProjectReq,
     db: Session,
@@ -33,16 +37,29 @@ def create_project(
     """
     Create new project
     """
-    existing_project = project_repository.find_project_by_name(db, project_req.name)
+    existing_project = await run_blocking(
+        project_repository.find_project_by_name, db, project_req.name
+    )
     if existing_project:
         raise ProjectAlreadyExist()
 
-    design_doc_paths = upload_file(project_req.name, files)
+    design_doc_paths = await run_blocking(upload_file, project_req.name, files)
 
-    is_repo = check_github_repo_exists(user_id, project_req.repo_fullname, db)
+    # Repository may have been created on GitHub after the last failed check
+    invalidate_github_repo_exists(project_req.repo_fullname, user_id)
+    is_repo = await check_github_repo_exists(user_id, project_req.repo_fullname, db)
     if not is_repo:
         raise RepositoryNotFoundInGitHub(project_req.repo_fullname)
 
+    return await run_blocking(save_project, user_id, project_req, design_doc_paths, db)
+
+
+def save_project(
+    user_id: int, project_req: ProjectReq, design_doc_paths: List[str], db: Session
+) -> ProjectRes:
+    """
+    Save the new project with its members (blocking, run in the blocking pool)
+    """
     project = Project(
         name=project_req.name,
         owner=user_id,
@@ -72,31 +89,24 @@ def create_project(
     return ProjectRes.from_project(saved_project, owner_user, design_doc_paths)
 
 
-def get_all_projects(user_id: int, db: Session) -> List[ProjectListRes]:
+async def get_all_projects(
+    user_id: int, db: Session, async_db: AsyncSession
+) -> List[ProjectListRes]:
     """
     Get all existing projects that user owns or participates in
     """
-    owned_projects = project_repository.find_project_by_owner(db, user_id)
-    participated_projects = project_user_repository.find_all_projects_by_user_id(
-        db, user_id
+    owned_projects = await project_async_repository.find_project_by_owner(
+        async_db, user_id
+    )
+    participated_projects = await project_async_repository.find_projects_by_member(
+        async_db, user_id
     )
 
     project_list = []
     added_project_ids = set()
 
-    for project in owned_projects:
-        is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
-        if not is_repo:
-            raise RepositoryNotFoundInGitHub(project.repo_fullname)
-
-        if project.id not in added_project_ids:
-            project_list.append(ProjectListRes.model_validate(project))
-            added_project_ids.add(project.id)
-
-    for project_user in participated_projects:
-        project = project_repository.find_project_by_id(db, project_user.project_id)
-
-        is_repo = check_github_repo_exists(user_id, project.repo_fullname, db)
+    for project in [*owned_projects, *participated_projects]:
+        is_repo = await check_github_repo_exists(user_id, project.repo_fullname, db)
         if not is_repo:
             raise RepositoryNotFoundInGitHub(project.repo_fullname)
 
@@ -107,30 +117,52 @@ def get_all_projects(user_id: int, db: Session) -> List[ProjectListRes]:
     return project_list
 
 
-def get_project(user_id: int, project_id: int, db: Session) -> ProjectRes:
+async def get_project(
+    user_id: int, project_id: int, db: Session, async_db: AsyncSession
+) -> ProjectRes:
     """
     Get the existing project by project id
     """
-    has_permission_to_access_project(user_id, project_id, db)
-
-    existing_project = project_repository.find_project_by_id(db, project_id)
-    if not existing_project:
-        raise ProjectNotFound()
+    existing_project = await find_accessible_project(user_id, project_id, async_db)
 
-    is_repo = check_github_repo_exists(user_id, existing_project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(
+        user_id, existing_project.repo_fullname, db
+    )
     if not is_repo:
         raise RepositoryNotFoundInGitHub(existing_project.repo_fullname)
 
-    owner_user = find_user_by_user_id(db, existing_project.owner)
+    owner_user = await user_async_repository.find_user_by_user_id(
+        async_db, existing_project.owner
+    )
     if not owner_user:
         raise UserNotFound()
 
-    design_docs = list_files_in_directory(existing_project.name)
+    design_docs = await run_blocking(list_files_in_directory, existing_project.name)
 
     return ProjectRes.from_project(existing_project, owner_user, design_docs)
 
 
-def update_project(
+async def find_accessible_project(
+    user_id: int, project_id: int, async_db: AsyncSession
+) -> Project:
+    """
+    Returns the project after checking the user may access it
+    """
+    existing_project = await project_async_repository.find_project_by_id(
+        async_db, project_id
+    )
+    if not existing_project:
+        raise ProjectNotFound()
+
+    is_owner = existing_project.owner == user_id
+    if not is_owner and not await project_async_repository.is_project_member(
+        async_db, project_id, user_id
+    ):
+        raise ProjectPermissionDenied()
+    return existing_project
+
+
+async def update_project(
     user_id: int,
     project_id: int,
     project_req: ProjectReq,
@@ -140,14 +172,38 @@ def update_project(
     """
     Update the existing project by project id
     """
-    has_permission_to_modify_project(user_id, project_id, db)
-
-    existing_project = project_repository.find_project_by_id(db, project_id)
+    existing_project = await run_blocking(
+        find_modifiable_project, user_id, project_id, db
+    )
 
-    is_repo = check_github_repo_exists(user_id, existing_project.repo_fullname, db)
+    is_repo = await check_github_repo_exists(
+        user_id, existing_project.repo_fullname, db
+    )
     if not is_repo:
         raise RepositoryNotFoundInGitHub(existing_project.repo_fullname)
 
+    return await run_blocking(
+        save_project_update, existing_project, project_req, files, db
+    )
+
+
+def find_modifiable_project(user_id: int, project_id: int, db: Session) -> Project:
+    """
+    Returns the project after checking the user may modify it (blocking)
+    """
+    has_permission_to_modify_project(user_id, project_id, db)
+    return project_repository.find_project_by_id(db, project_id)
+
+
+def save_project_update(
+    existing_project: Project,
+    project_req: ProjectReq,
+    files: List[UploadFile],
+    db: Session,
+) -> ProjectRes:
+    """
+    Apply the update to the design documents and the project (blocking)
+    """
     updated_design_doc_paths = update_file(
         existing_project.name, files, project_req.design_docs
     )
@@ -159,6 +215,10 @@ def update_project(
 
         os.rename(old_project_dir, new_project_dir)
 
+    if existing_project.repo_fullname != project_req.repo_fullname:
+        invalidate_github_repo_exists(existing_project.repo_fullname)
+        invalidate_github_repo_exists(project_req.repo_fullname)
+
     existing_project.name = project_req.name
     existing_project.repo_fullname = project_req.repo_fullname
     existing_project.start_date = project_req.start_date
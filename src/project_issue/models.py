@@ -0,0 +1,38 @@
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Identity,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+
+from src.config.database import Base
+
+
+class ProjectIssue(Base):
+    __tablename__ = "project_issue"
+    __table_args__ = (UniqueConstraint("repo_fullname", "issue_number"),)
+
+    id = Column(Integer, Identity(), primary_key=True, index=True)
+    repo_fullname = Column(String(255), index=True)
+    issue_number = Column(Integer)
+    title = Column(String(300))
+    body = Column(Text(16777215))
+    closed = Column(Boolean, default=False)
+    assignees = Column(JSON)
+    labels = Column(JSON)
+    priority = Column(String(10))
+    iteration = Column(Integer)
+    updated_at = Column(DateTime)
+
+
+class ProjectIssueSync(Base):
+    __tablename__ = "project_issue_sync"
+
+    repo_fullname = Column(String(255), primary_key=True)
+    synced_at = Column(DateTime)
+    webhook_received_at = Column(DateTime)
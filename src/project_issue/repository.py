@@ -0,0 +1,179 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.models import ProjectIssue, ProjectIssueSync
+from src.response.error_definitions import SQLError
+
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
+
+def upsert_project_issues(
+    db: Session, repo_fullname: str, project_issues: list[ProjectIssue]
+) -> None:
+    """
+    Insert or update the issues in one transaction
+
+    Rows already holding a newer version (by GitHub's updated_at) are kept, so
+    a late or redelivered webhook or an overlapping sync page does not bring
+    back older state. When another worker (or a webhook) inserted one of the
+    issues first, the batch is retried once so it updates that row. Raises
+    SQLError if it still fails, so callers do not record the batch as synced.
+    """
+    if not project_issues:
+        return
+
+    for attempt in range(2):
+        try:
+            issue_numbers = [issue.issue_number for issue in project_issues]
+            result = db.execute(
+                select(ProjectIssue).filter(
+                    ProjectIssue.repo_fullname == repo_fullname,
+                    ProjectIssue.issue_number.in_(issue_numbers),
+                )
+            )
+            existing_issues = {
+                issue.issue_number: issue for issue in result.scalars().all()
+            }
+
+            for project_issue in project_issues:
+                existing_issue = existing_issues.get(project_issue.issue_number)
+                if not existing_issue:
+                    db.add(project_issue)
+                    continue
+                if is_older_issue(project_issue, existing_issue):
+                    continue
+
+                existing_issue.title = project_issue.title
+                existing_issue.body = project_issue.body
+                existing_issue.closed = project_issue.closed
+                existing_issue.assignees = project_issue.assignees
+                existing_issue.labels = project_issue.labels
+                existing_issue.priority = project_issue.priority
+                existing_issue.iteration = project_issue.iteration
+                existing_issue.updated_at = project_issue.updated_at
+
+            db.commit()
+            return
+        except IntegrityError as e:
+            db.rollback()
+            if attempt:
+                logger.error(f"Project issue upsert conflicted again: {e}")
+                raise SQLError()
+            logger.warning(f"Concurrent project issue upsert, retrying: {e}")
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during project issue upsert: {e}")
+            db.rollback()
+            raise SQLError()
+
+
+def is_older_issue(project_issue: ProjectIssue, existing_issue: ProjectIssue) -> bool:
+    """
+    Check if the incoming issue is an older version than the stored one
+    """
+    if not project_issue.updated_at or not existing_issue.updated_at:
+        return False
+    return project_issue.updated_at < existing_issue.updated_at
+
+
+def find_all_project_issues_by_repo_fullname(
+    db: Session, repo_fullname: str
+) -> list[ProjectIssue]:
+    try:
+        result = db.execute(
+            select(ProjectIssue)
+            .filter(ProjectIssue.repo_fullname == repo_fullname)
+            .order_by(ProjectIssue.issue_number.desc())
+        )
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def count_project_issues(
+    db: Session, repo_fullname: str
+) -> list[tuple[bool, str, int, int]]:
+    """
+    Returns (closed, priority, iteration, count) rows of the repository
+    """
+    try:
+        result = db.execute(
+            select(
+                ProjectIssue.closed,
+                ProjectIssue.priority,
+                ProjectIssue.iteration,
+                func.count(),
+            )
+            .filter(ProjectIssue.repo_fullname == repo_fullname)
+            .group_by(
+                ProjectIssue.closed, ProjectIssue.priority, ProjectIssue.iteration
+            )
+        )
+        return [
+            (bool(closed), priority, iteration, count)
+            for closed, priority, iteration, count in result.all()
+        ]
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def find_project_issue_sync(db: Session, repo_fullname: str) -> ProjectIssueSync | None:
+    try:
+        result = db.execute(
+            select(ProjectIssueSync).filter(
+                ProjectIssueSync.repo_fullname == repo_fullname
+            )
+        )
+        return result.scalars().first()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def save_project_issue_sync(
+    db: Session,
+    repo_fullname: str,
+    synced_at: datetime | None = None,
+    webhook_received_at: datetime | None = None,
+) -> None:
+    try:
+        issue_sync = db.get(ProjectIssueSync, repo_fullname)
+        if not issue_sync:
+            issue_sync = ProjectIssueSync(repo_fullname=repo_fullname)
+            db.add(issue_sync)
+
+        if synced_at:
+            issue_sync.synced_at = synced_at
+        if webhook_received_at:
+            issue_sync.webhook_received_at = webhook_received_at
+
+        db.commit()
+    except IntegrityError as e:
+        logger.warning(f"Concurrent project issue sync update: {e}")
+        db.rollback()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during project issue sync update: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def delete_project_issue(db: Session, repo_fullname: str, issue_number: int) -> None:
+    try:
+        db.query(ProjectIssue).filter(
+            ProjectIssue.repo_fullname == repo_fullname,
+            ProjectIssue.issue_number == issue_number,
+        ).delete(synchronize_session=False)
+        db.commit()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
@@ -118,6 +118,14 @@ class AccessTokenNotFound(UnauthorizedException):
         )
 
 
+class InvalidWebhookSignature(UnauthorizedException):
+    def __init__(self):
+        super().__init__(
+            title="유효하지 않은 웹훅 서명",
+            detail="GitHub 웹훅 서명(X-Hub-Signature-256)이 없거나 일치하지 않습니다.",
+        )
+
+
 class ProjectOwnerMismatched(UnauthorizedException):
     def __init__(self):
         super().__init__(
@@ -275,6 +283,24 @@ class InvalidFileType(UnsupportedMediaType):
         )
 
 
+"""
+429 TOO_MANY_REQUESTS
+"""
+
+
+class TooManyRequestsException(BaseAppException):
+    def __init__(self, title: str, detail: str | None = None):
+        super().__init__(title=title, status_code=429, detail=detail)
+
+
+class GitHubRateLimitExceeded(TooManyRequestsException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            title="GitHub API 요청 한도 초과",
+            detail=f"GitHub API 요청 한도를 모두 사용했습니다. {retry_after}초 후에 다시 시도해 주세요.",
+        )
+
+
 """
 500 INTERNAL_SERVER_ERROR
 """
@@ -1,5 +1,51 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
 import httpx
 
+from src.config.config import (
+    ERROR_REPORT_BATCH_SIZE,
+    ERROR_REPORT_FLUSH_SECONDS,
+    ERROR_REPORT_QUEUE_SIZE,
+    ERROR_REPORT_WINDOW_SECONDS,
+)
+from src.config.logger_config import setup_logger
+
+ERROR_REPORT_URL = "https://errorping.jhssong.com/report-error"
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class ErrorReport:
+    discord_channel_id: str
+    trace_id: str
+    type: str
+    title: str
+    status: int
+    detail: str
+    instance: str
+    method: str
+    trace: str
+    count: int = 1
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.type, self.instance)
+
+
+error_queue: asyncio.Queue[ErrorReport] | None = None
+error_reporter_task: asyncio.Task | None = None
+dropped_reports = 0
+
+# (type, path) -> report waiting in the queue, repeats only bump its count
+queued_reports: dict[tuple[str, str], ErrorReport] = {}
+
+# (type, path) -> when it was last sent, and the latest report held back since
+last_reported_at: dict[tuple[str, str], float] = {}
+suppressed_reports: dict[tuple[str, str], ErrorReport] = {}
+
 
 async def report_error_to_discord(
     discord_channel_id: str,
@@ -12,23 +58,190 @@ async def report_error_to_discord(
     method: str,
     trace: str,
 ) -> None:
-    url = "https://errorping.jhssong.com/report-error"
+    """
+    Queue the error for the background reporter
+
+    Returns right away. An error already waiting in the queue is counted
+    instead of queued again, and when the queue is full the report is dropped.
+    """
+    global dropped_reports
+    if error_reporter_task is None:
+        start_error_reporter()
+
+    report = ErrorReport(
+        discord_channel_id=discord_channel_id,
+        trace_id=trace_id,
+        type=type,
+        title=title,
+        status=status,
+        detail=detail,
+        instance=instance,
+        method=method,
+        trace=trace,
+    )
+    queued = queued_reports.get(report.key)
+    if queued is not None:
+        queued.count += 1
+        return
+
+    try:
+        error_queue.put_nowait(report)
+    except asyncio.QueueFull:
+        dropped_reports += 1
+        return
+    queued_reports[report.key] = report
+
+
+def coalesce_reports(reports: list[ErrorReport]) -> list[ErrorReport]:
+    """
+    Hold back errors already sent within ERROR_REPORT_WINDOW_SECONDS
+
+    Held back reports are counted into the next report of the same error, or
+    sent by flush_suppressed_reports once the window is over.
+    """
+    now = time.monotonic()
+    sendable = []
+    for report in reports:
+        key = report.key
+        queued_reports.pop(key, None)
+        if now - last_reported_at.get(key, float("-inf")) < ERROR_REPORT_WINDOW_SECONDS:
+            suppressed = suppressed_reports.get(key)
+            if suppressed is not None:
+                report.count += suppressed.count
+            suppressed_reports[key] = report
+            continue
+        suppressed = suppressed_reports.pop(key, None)
+        if suppressed is not None:
+            report.count += suppressed.count
+        last_reported_at[key] = now
+        sendable.append(report)
+    return sendable
+
+
+def flush_suppressed_reports(force: bool = False) -> list[ErrorReport]:
+    """
+    Returns the held back reports whose window is over (all of them if force)
+    """
+    now = time.monotonic()
+    sendable = []
+    for key, report in list(suppressed_reports.items()):
+        if force or now - last_reported_at[key] >= ERROR_REPORT_WINDOW_SECONDS:
+            del suppressed_reports[key]
+            last_reported_at[key] = now
+            sendable.append(report)
+    return sendable
+
+
+async def send_error_report(client: httpx.AsyncClient, report: ErrorReport):
+    detail = report.detail
+    if report.count > 1:
+        detail = f"{detail} (x{report.count})"
+
     payload = {
-        "discordChannelId": discord_channel_id,
+        "discordChannelId": report.discord_channel_id,
         "error": {
-            "traceId": trace_id,
-            "type": type,
-            "title": title,
-            "status": status,
+            "traceId": report.trace_id,
+            "type": report.type,
+            "title": report.title,
+            "status": report.status,
             "detail": detail,
-            "instance": instance,
-            "method": method,
+            "instance": report.instance,
+            "method": report.method,
         },
-        "trace": trace,
+        "trace": report.trace,
     }
 
-    async with httpx.AsyncClient() as client:
-        res = await client.post(url, json=payload)
-
+    try:
+        res = await client.post(ERROR_REPORT_URL, json=payload)
         if res.status_code != 200:
-            print(f"Failed to report error: {res.status_code} - {res.text}")
+            logger.warning(f"Failed to report error: {res.status_code} - {res.text}")
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to report error: {e}")
+
+
+async def send_error_reports(
+    client: httpx.AsyncClient, reports: list[ErrorReport], force: bool = False
+):
+    global dropped_reports
+    if dropped_reports:
+        logger.warning(f"Dropped {dropped_reports} error reports (queue full)")
+        dropped_reports = 0
+
+    sendable = coalesce_reports(reports) + flush_suppressed_reports(force)
+    await asyncio.gather(*(send_error_report(client, report) for report in sendable))
+
+
+async def collect_error_reports() -> list[ErrorReport]:
+    """
+    Wait for a report, then gather more for up to ERROR_REPORT_FLUSH_SECONDS
+
+    Returns nothing when a held back report's window ends first, so it is
+    still sent when the error stops happening
+    """
+    timeout = None
+    if suppressed_reports:
+        window_ends_at = min(
+            last_reported_at[key] + ERROR_REPORT_WINDOW_SECONDS
+            for key in suppressed_reports
+        )
+        timeout = max(window_ends_at - time.monotonic(), 0)
+
+    try:
+        first = await asyncio.wait_for(error_queue.get(), timeout)
+    except asyncio.TimeoutError:
+        return []
+
+    reports = [first]
+    deadline = time.monotonic() + ERROR_REPORT_FLUSH_SECONDS
+    while len(reports) < ERROR_REPORT_BATCH_SIZE:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            reports.append(await asyncio.wait_for(error_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return reports
+
+
+async def run_error_reporter():
+    async with httpx.AsyncClient(timeout=10) as client:
+        try:
+            while True:
+                await send_error_reports(client, await collect_error_reports())
+        except asyncio.CancelledError:
+            # Flush what is left on shutdown
+            reports = []
+            while not error_queue.empty():
+                reports.append(error_queue.get_nowait())
+            await send_error_reports(client, reports, force=True)
+            raise
+
+
+def start_error_reporter():
+    """
+    Start the background error reporter (called on server startup)
+    """
+    global error_queue, error_reporter_task
+    if error_reporter_task is not None:
+        return
+
+    error_queue = asyncio.Queue(maxsize=ERROR_REPORT_QUEUE_SIZE)
+    error_reporter_task = asyncio.get_running_loop().create_task(run_error_reporter())
+    logger.info("✅ Error reporter started")
+
+
+async def stop_error_reporter():
+    """
+    Send the queued reports and stop the reporter (called on server shutdown)
+    """
+    global error_reporter_task
+    if error_reporter_task is None:
+        return
+
+    error_reporter_task.cancel()
+    try:
+        await asyncio.wait_for(error_reporter_task, ERROR_REPORT_FLUSH_SECONDS + 10)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        pass
+    error_reporter_task = None
@@ -126,6 +126,15 @@ def issue_rescheduling_delete_success(type: str):
     return success_handler(200, f"이슈 변경 요청서 {type} 성공")
 
 
+"""
+Webhook Success Response
+"""
+
+
+def webhook_receive_success():
+    return success_handler(200, "GitHub 웹훅 수신 성공")
+
+
 """
 User Repository Success Response
 """
@@ -141,3 +150,16 @@ def user_repository_read_success(data: T):
 
 def user_repository_from_github_read_success(data: T):
     return success_handler(200, "GitHub 레포지토리 조회 성공", data)
+
+
+"""
+Metrics Success Response
+"""
+
+
+def github_budget_read_success(data: T):
+    return success_handler(200, "GitHub API 요청 한도 조회 성공", data)
+
+
+def database_pool_read_success(data: T):
+    return success_handler(200, "데이터베이스 커넥션 풀 조회 성공", data)
@@ -0,0 +1,214 @@
+from src.common.util.github_client import github_graphql
+from src.config.config import GITHUB_GRAPHQL_SEARCH_REPOS
+from src.stat.service import build_activity, parse_related_issues
+
+MERGED_PULL_REQUESTS_QUERY = """
+query($query: String!, $cursor: String) {
+  search(type: ISSUE, query: $query, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        body
+        createdAt
+        mergedAt
+        repository { nameWithOwner }
+        closingIssuesReferences(first: 20) { nodes { number } }
+      }
+    }
+  }
+}
+"""
+
+VIEWER_ID_QUERY = "query { viewer { id } }"
+
+COMMIT_HISTORY_FIELDS = """
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 100, after: $cursor%(index)d, author: {id: $authorId}) {
+          pageInfo { hasNextPage endCursor }
+          nodes { oid message }
+        }
+      }
+    }
+  }
+"""
+
+
+async def get_merged_pull_requests(
+    repo_fullnames: list[str], user_name, headers, merged_after: dict[str, str]
+) -> dict[str, list[dict]]:
+    """
+    Get merged pull requests of the user over the repositories with the search
+    API (GITHUB_GRAPHQL_SEARCH_REPOS repositories per query)
+
+    merged_after maps repo_fullname to the merged_at high-water mark
+    """
+    pr_lists = {repo_fullname: [] for repo_fullname in repo_fullnames}
+
+    for start in range(0, len(repo_fullnames), GITHUB_GRAPHQL_SEARCH_REPOS):
+        repos = repo_fullnames[start : start + GITHUB_GRAPHQL_SEARCH_REPOS]
+        query = " ".join(
+            [f"is:pr is:merged author:{user_name}"]
+            + [f"repo:{repo_fullname}" for repo_fullname in repos]
+        )
+        marks = [merged_after.get(repo_fullname) for repo_fullname in repos]
+        if all(marks):
+            query += f" merged:>{min(marks)}"
+
+        cursor = None
+        while True:
+            data = await github_graphql(
+                MERGED_PULL_REQUESTS_QUERY,
+                {"query": query, "cursor": cursor},
+                headers,
+            )
+            search = data["search"]
+            for pr in search["nodes"]:
+                repo_fullname = pr["repository"]["nameWithOwner"]
+                if repo_fullname not in pr_lists:
+                    continue
+                mark = merged_after.get(repo_fullname)
+                if mark and pr["mergedAt"] <= mark:
+                    continue
+
+                body = pr["body"] or ""
+                related_issues = parse_related_issues(body)
+                for issue in pr["closingIssuesReferences"]["nodes"]:
+                    if issue["number"] not in related_issues:
+                        related_issues.append(issue["number"])
+
+                pr_lists[repo_fullname].append(
+                    {
+                        "repository": repo_fullname,
+                        "pull_request_number": pr["number"],
+                        "author": user_name,
+                        "title": pr["title"],
+                        "body": body,
+                        "related_issues": related_issues,
+                        "created_at": pr["createdAt"],
+                        "merged_at": pr["mergedAt"],
+                    }
+                )
+
+            if not search["pageInfo"]["hasNextPage"]:
+                break
+            cursor = search["pageInfo"]["endCursor"]
+
+    return pr_lists
+
+
+def build_commit_history_query(count: int) -> str:
+    """
+    Build a query reading the default branch history of `count` repositories
+    (aliased r0, r1, ...)
+    """
+    variables = ["$authorId: ID!"]
+    fields = []
+    for index in range(count):
+        variables += [
+            f"$owner{index}: String!",
+            f"$name{index}: String!",
+            f"$cursor{index}: String",
+        ]
+        fields.append(
+            f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{"
+            + COMMIT_HISTORY_FIELDS % {"index": index}
+            + "}"
+        )
+    return f"query({', '.join(variables)}) {{\n" + "\n".join(fields) + "\n}"
+
+
+async def get_commits(
+    repo_fullnames: list[str], headers, until_shas: dict[str, str]
+) -> dict[str, tuple[list[dict], bool]]:
+    """
+    Get commits (sha, message) of the token owner on the default branch of
+    every repository, paging all repositories in the same query
+
+    Each repository stops before its until_sha commit. Returns the commits and
+    whether until_sha was reached. Repositories GraphQL could not read are
+    left out
+    """
+    viewer = await github_graphql(VIEWER_ID_QUERY, {}, headers)
+    author_id = viewer["viewer"]["id"]
+
+    commit_lists = {}
+    cursors = {repo_fullname: None for repo_fullname in repo_fullnames}
+    while cursors:
+        repos = list(cursors)
+        variables = {"authorId": author_id}
+        for index, repo_fullname in enumerate(repos):
+            owner, name = repo_fullname.split("/", 1)
+            variables[f"owner{index}"] = owner
+            variables[f"name{index}"] = name
+            variables[f"cursor{index}"] = cursors[repo_fullname]
+
+        data = await github_graphql(
+            build_commit_history_query(len(repos)), variables, headers
+        )
+
+        next_cursors = {}
+        for index, repo_fullname in enumerate(repos):
+            repository = data.get(f"r{index}")
+            if repository is None:
+                continue
+
+            commit_list, _ = commit_lists.setdefault(repo_fullname, ([], False))
+            branch = repository["defaultBranchRef"]
+            if branch is None:  # Empty repository
+                continue
+
+            history = branch["target"]["history"]
+            until_sha = until_shas.get(repo_fullname)
+            for commit in history["nodes"]:
+                if until_sha and commit["oid"] == until_sha:
+                    commit_lists[repo_fullname] = (commit_list, True)
+                    break
+                commit_list.append({"sha": commit["oid"], "message": commit["message"]})
+            else:
+                if history["pageInfo"]["hasNextPage"]:
+                    next_cursors[repo_fullname] = history["pageInfo"]["endCursor"]
+        cursors = next_cursors
+
+    return commit_lists
+
+
+async def collect_repository_activities(
+    repo_fullnames: list[str], user_name, token, marks: dict | None = None
+) -> dict[str, dict]:
+    """
+    Collect pull requests and commits of every repository with a handful of
+    GraphQL queries
+
+    marks maps repo_fullname to its high-water mark (last_merged_at,
+    last_commit_sha) so only newer activity is fetched.
+    Repositories GraphQL could not read are left out
+    """
+    marks = marks or {}
+    merged_after = {
+        repo_fullname: mark.get("last_merged_at")
+        for repo_fullname, mark in marks.items()
+    }
+    until_shas = {
+        repo_fullname: mark.get("last_commit_sha")
+        for repo_fullname, mark in marks.items()
+    }
+
+    headers = {"Authorization": f"bearer {token}"}
+    pr_lists = await get_merged_pull_requests(
+        repo_fullnames, user_name, headers, merged_after
+    )
+    commit_lists = await get_commits(repo_fullnames, headers, until_shas)
+
+    return {
+        repo_fullname: build_activity(
+            pr_lists[repo_fullname],
+            commit_list,
+            reached_commit_mark,
+            until_shas.get(repo_fullname),
+        )
+        for repo_fullname, (commit_list, reached_commit_mark) in commit_lists.items()
+    }
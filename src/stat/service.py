@@ -1,19 +1,38 @@
-import requests
+import asyncio
+from contextlib import aclosing
 
-from src.response.error_definitions import GitHubApiError
+import httpx
 
+from src.common.util.github_client import (
+    GITHUB_URL,
+    github_get,
+    paginate,
+    raise_github_api_error,
+)
+from src.config.config import (
+    GITHUB_DETAIL_CONCURRENCY,
+    GITHUB_REPO_CONCURRENCY,
+    GITHUB_REPO_TIMEOUT_SECONDS,
+)
+from src.config.logger_config import setup_logger
+from src.response.error_definitions import BaseAppException
 
-def get_repositories(token):
+logger = setup_logger(__name__)
+
+
+async def get_repositories(token):
     """
     Get all repositories the user owns, collaborates on, or is a member of the organization for
     """
     headers = {"Authorization": f"token {token}"}
-    repos_url = f"https://api.github.com/user/repos?visibility=all&affiliation=owner,collaborator,organization_member"
-    response = requests.get(repos_url, headers=headers)
-    repos_json = response.json()
+    repos_url = f"{GITHUB_URL}/user/repos"
+    params = {
+        "visibility": "all",
+        "affiliation": "owner,collaborator,organization_member",
+    }
 
     repo_list = []
-    for repo in repos_json:
+    async for repo in paginate(repos_url, headers=headers, params=params):
         data = {
             "name": repo["full_name"],
             "private": repo["private"],
@@ -22,97 +41,194 @@ def get_repositories(token):
         }
         repo_list.append(data)
 
-    if response.status_code != 200:
-        try:
-            error_message = response.json().get("message", "")
-        except Exception:
-            error_message = response.text or "No error message provided"
-        raise GitHubApiError(response.status_code, detail=error_message)
-
     return repo_list
 
 
-def get_pull_requests(repo_fullname, user_name, token):
+def parse_related_issues(body: str) -> list[int]:
     """
-    Get all pull requests owned by user
+    Parse related issues from the PR body (close # format)
     """
-    headers = {"Authorization": f"token {token}"}
-    prs_url = f"https://api.github.com/repos/{repo_fullname}/pulls?state=all"
-    response = requests.get(prs_url, headers=headers)
+    related_issues = []
+    for line in body.splitlines():
+        if line.startswith("close #"):
+            try:
+                issue_number = int(line.split("#")[1].strip())
+                related_issues.append(issue_number)
+            except (ValueError, IndexError):
+                pass
+    return related_issues
+
+
+def build_pull_request(repo_fullname, pr, user_name, body: str) -> dict:
+    """
+    Returns the stored form of a merged PR (REST API or webhook payload)
+    """
+    return {
+        "repository": repo_fullname,
+        "pull_request_number": pr["number"],
+        "author": user_name,
+        "title": pr["title"],
+        "body": body,
+        "related_issues": parse_related_issues(body),
+        "created_at": pr["created_at"],
+        "merged_at": pr["merged_at"],
+    }
+
+
+async def get_pull_request_body(pr, headers, semaphore: asyncio.Semaphore) -> str:
+    """
+    Returns the PR body, reading the PR details only if the list item lacks it
+    """
+    if "body" in pr:
+        return pr["body"] or ""
 
+    async with semaphore:
+        response = await github_get(pr["url"], headers=headers)
     if response.status_code != 200:
-        try:
-            error_message = response.json().get("message", "")
-        except Exception:
-            error_message = response.text or "No error message provided"
-        raise GitHubApiError(response.status_code, detail=error_message)
-
-    prs = response.json()
-
-    pr_list = []
-    for pr in prs:
-        if pr["user"]["login"] == user_name and pr["merged_at"]:
-            pr_details_url = pr["url"]
-            response = requests.get(pr_details_url, headers=headers)
-
-            if response.status_code != 200:
-                try:
-                    error_message = response.json().get("message", "")
-                except Exception:
-                    error_message = response.text or "No error message provided"
-                raise GitHubApiError(response.status_code, detail=error_message)
-
-            pr_details = response.json()
-
-            # Parse related_issues (close # format)
-            body = pr_details.get("body", "")  # Set blank if body is empty
-            body = body if body is not None else ""
-
-            related_issues = []
-            for line in body.splitlines():
-                if line.startswith("close #"):
-                    try:
-                        issue_number = int(line.split("#")[1].strip())
-                        related_issues.append(issue_number)
-                    except (ValueError, IndexError):
-                        pass
-
-            pr_list.append(
-                {
-                    "repository": repo_fullname,
-                    "pull_request_number": pr["number"],
-                    "author": user_name,
-                    "title": pr["title"],
-                    "body": body,
-                    "related_issues": related_issues,
-                    "created_at": pr["created_at"],
-                    "merged_at": pr["merged_at"],
-                }
-            )
+        raise_github_api_error(response)
+    return response.json().get("body") or ""
 
-    return pr_list
 
+async def get_pull_requests(repo_fullname, user_name, token, merged_after=None):
+    """
+    Get all pull requests owned by user
 
-def get_commits(repo_fullname, user_name, token):
+    The list payload already carries the PR body, so details are fetched only
+    for items without one (GITHUB_DETAIL_CONCURRENCY at a time).
+    With merged_after (ISO 8601), only PRs merged after it are returned and the
+    listing stops at the first PR not updated since then.
+    """
     headers = {"Authorization": f"token {token}"}
-    commits_url = (
-        f"https://api.github.com/repos/{repo_fullname}/commits?author={user_name}"
+    prs_url = f"{GITHUB_URL}/repos/{repo_fullname}/pulls"
+    params = {"state": "all"}
+    if merged_after:
+        params = {"state": "closed", "sort": "updated", "direction": "desc"}
+
+    merged_prs = []
+    async with aclosing(paginate(prs_url, headers=headers, params=params)) as prs:
+        async for pr in prs:
+            if merged_after and pr["updated_at"] <= merged_after:
+                break
+            if pr["user"]["login"] != user_name or not pr["merged_at"]:
+                continue
+            if merged_after and pr["merged_at"] <= merged_after:
+                continue
+            merged_prs.append(pr)
+
+    semaphore = asyncio.Semaphore(GITHUB_DETAIL_CONCURRENCY)
+    bodies = await asyncio.gather(
+        *(get_pull_request_body(pr, headers, semaphore) for pr in merged_prs)
     )
-    response = requests.get(commits_url, headers=headers)
 
-    if response.status_code != 200:
-        if response.json()["message"] == "Git Repository is empty.":
-            return []
-        try:
-            error_message = response.json().get("message", "")
-        except Exception:
-            error_message = response.text or "No error message provided"
-        raise GitHubApiError(response.status_code, detail=error_message)
+    return [
+        build_pull_request(repo_fullname, pr, user_name, body)
+        for pr, body in zip(merged_prs, bodies)
+    ]
+
+
+async def get_commits(
+    repo_fullname, user_name, token, until_sha=None
+) -> tuple[list[dict], bool]:
+    """
+    Get commits (sha, message) of the user, newest first
 
-    commits = response.json()
+    With until_sha, the listing stops before that commit. Also returns whether
+    until_sha was reached (False means the list is the whole history).
+    """
+    headers = {"Authorization": f"token {token}"}
+    commits_url = f"{GITHUB_URL}/repos/{repo_fullname}/commits"
 
     commit_list = []
-    for commit in commits:
-        commit_list.append(commit["commit"]["message"])
+    async with aclosing(
+        paginate(commits_url, headers=headers, params={"author": user_name})
+    ) as commits:
+        async for commit in commits:
+            if until_sha and commit["sha"] == until_sha:
+                return commit_list, True
+            commit_list.append(
+                {"sha": commit["sha"], "message": commit["commit"]["message"]}
+            )
 
-    return commit_list
+    return commit_list, False
+
+
+def build_activity(
+    prs: list[dict], commits: list[dict], reached_commit_mark: bool, until_sha=None
+) -> dict:
+    """
+    Returns collected activity of a repository
+
+    reached_commit_mark tells whether commits (sha, message) are a delta ending
+    at the mark or the whole history
+    """
+    return {
+        "prs": prs,
+        "commits": commits,
+        "last_commit_sha": (
+            commits[0]["sha"] if commits else until_sha if reached_commit_mark else None
+        ),
+        "reached_commit_mark": reached_commit_mark,
+    }
+
+
+async def get_repository_activity(
+    repo_fullname, user_name, token, semaphore: asyncio.Semaphore, mark=None
+) -> dict | None:
+    """
+    Get pull requests and commits of one repository (since the mark if given)
+
+    Returns None if the repository failed or took longer than
+    GITHUB_REPO_TIMEOUT_SECONDS
+    """
+    mark = mark or {}
+    async with semaphore:
+        try:
+            prs, (commits, reached_commit_mark) = await asyncio.wait_for(
+                asyncio.gather(
+                    get_pull_requests(
+                        repo_fullname, user_name, token, mark.get("last_merged_at")
+                    ),
+                    get_commits(
+                        repo_fullname, user_name, token, mark.get("last_commit_sha")
+                    ),
+                ),
+                timeout=GITHUB_REPO_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Activity collection of {repo_fullname} timed out")
+            return None
+        except (BaseAppException, httpx.HTTPError) as e:
+            logger.warning(f"Activity collection of {repo_fullname} failed: {e}")
+            return None
+
+    return build_activity(
+        prs, commits, reached_commit_mark, mark.get("last_commit_sha")
+    )
+
+
+async def collect_repository_activities(
+    repo_fullnames: list[str], user_name, token, marks: dict | None = None
+) -> dict[str, dict]:
+    """
+    Collect pull requests and commits of every repository concurrently
+    (GITHUB_REPO_CONCURRENCY at a time)
+
+    marks maps repo_fullname to its high-water mark (last_merged_at,
+    last_commit_sha) so only newer activity is fetched.
+    Failed repositories are left out so the others are still returned
+    """
+    marks = marks or {}
+    semaphore = asyncio.Semaphore(GITHUB_REPO_CONCURRENCY)
+    activities = await asyncio.gather(
+        *(
+            get_repository_activity(
+                repo_fullname, user_name, token, semaphore, marks.get(repo_fullname)
+            )
+            for repo_fullname in repo_fullnames
+        )
+    )
+    return {
+        repo_fullname: activity
+        for repo_fullname, activity in zip(repo_fullnames, activities)
+        if activity is not None
+    }
@@ -0,0 +1,20 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.models import User
+from src.response.error_definitions import SQLError
+
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
+
+async def find_user_by_user_id(db: AsyncSession, user_id: int) -> User | None:
+    try:
+        result = await db.execute(select(User).filter(User.id == user_id))
+        return result.scalars().first()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        await db.rollback()
+        raise SQLError()
@@ -3,6 +3,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import NoResultFound
 
+from src.auth.util.user_cache import forget_user_locally
 from src.config.logger_config import add_daily_file_handler, setup_logger
 from src.models import User
 from src.response.error_definitions import SQLError
@@ -89,8 +90,10 @@ def update_user(db: Session, user: User) -> User:
 
 def delete_user(db: Session, user: User):
     try:
+        user_id = user.id
         db.delete(user)
         db.commit()
+        forget_user_locally(user_id)
     except SQLAlchemyError as e:
         logger.error(f"Database error: {e}")
         db.rollback()
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 
-from auth.service import REFRESH_TOKEN_REDIS
-from auth.util.redis import delete_token_from_redis, get_token_from_redis
+from auth.util.redis import (
+    REFRESH_TOKEN_REDIS,
+    delete_token_from_redis,
+    get_token_from_redis,
+)
+from src.auth.util.user_cache import forget_user
 from src.models import User
 from src.project import repository as project_repository
 from src.project_user import repository as project_user_repository
@@ -12,6 +16,7 @@ from src.response.error_definitions import (
 )
 from src.user import repository as user_repository
 from src.user.schemas import UserReq, UserRes
+from src.user_activity import repository as user_activity_repository
 from src.user_repository import repository as user_repository_repository
 
 
@@ -92,8 +97,9 @@ async def unregister(user_id: int, db: Session):
     if project_list or owned_project_list:
         raise ProjectUserExist()
 
-    # Delete user repositories
+    # Delete user repositories and activity snapshots
     user_repository_repository.delete_all_repositories_by_user_id(db, user_id)
+    user_activity_repository.delete_all_user_activities_by_user_id(db, user_id)
 
     # Delete user from database
     user = user_repository.find_user_by_user_id(db, user_id)
@@ -101,7 +107,7 @@ async def unregister(user_id: int, db: Session):
         raise UserNotFound()
 
     user_repository.delete_user(db, user)
+    await forget_user(user_id)
 
     # Delete tokens from redis
-    redis_refresh_token = await get_token_from_redis(REFRESH_TOKEN_REDIS, user_id)
-    await delete_token_from_redis(redis_refresh_token)
+    await delete_token_from_redis(REFRESH_TOKEN_REDIS, user_id)
@@ -0,0 +1,26 @@
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from src.config.database import Base
+
+
+class UserActivity(Base):
+    __tablename__ = "user_activity"
+    __table_args__ = (UniqueConstraint("user_id", "repo_fullname"),)
+
+    id = Column(Integer, Identity(), primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id"), index=True)
+    repo_fullname = Column(String(255))
+    prs = Column(JSON)
+    commits = Column(JSON)
+    last_merged_at = Column(String(20))  # GitHub ISO 8601 (e.g. 2024-01-01T00:00:00Z)
+    last_commit_sha = Column(String(40))
+    updated_at = Column(DateTime)
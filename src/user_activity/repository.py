@@ -0,0 +1,70 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.models import UserActivity
+from src.response.error_definitions import SQLError
+
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
+
+def find_all_user_activities_by_user_id(
+    db: Session, user_id: int
+) -> list[UserActivity]:
+    try:
+        result = db.execute(
+            select(UserActivity).filter(UserActivity.user_id == user_id)
+        )
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def find_all_user_activities_by_repo_fullname(
+    db: Session, repo_fullname: str, user_ids: list[int]
+) -> list[UserActivity]:
+    try:
+        result = db.execute(
+            select(UserActivity).filter(
+                UserActivity.repo_fullname == repo_fullname,
+                UserActivity.user_id.in_(user_ids),
+            )
+        )
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def save_user_activities(db: Session, user_activities: list[UserActivity]) -> None:
+    try:
+        if not user_activities:
+            return
+
+        db.add_all(user_activities)
+        db.commit()
+    except IntegrityError as e:
+        # Another assessment of the same user saved the snapshot first
+        logger.warning(f"Concurrent user activity save: {e}")
+        db.rollback()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during user activity save: {e}")
+        db.rollback()
+        raise SQLError()
+
+
+def delete_all_user_activities_by_user_id(db: Session, user_id: int) -> None:
+    try:
+        db.query(UserActivity).filter(UserActivity.user_id == user_id).delete(
+            synchronize_session=False
+        )
+        db.commit()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error: {e}")
+        db.rollback()
+        raise SQLError()
@@ -0,0 +1,219 @@
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy.orm import Session
+
+from src.common.util.executor import run_blocking
+from src.config.config import GITHUB_GRAPHQL_ENABLED
+from src.config.logger_config import setup_logger
+from src.models import UserActivity
+from src.response.error_definitions import BaseAppException
+from src.stat import graphql as stat_graphql
+from src.stat import service as stat_service
+from src.user.repository import find_all_users_by_github_names
+from src.user_activity import repository as user_activity_repository
+
+logger = setup_logger(__name__)
+
+
+async def fetch_activities(
+    repo_fullnames: list[str], user_name, token, marks: dict
+) -> dict[str, dict]:
+    """
+    Fetch activity since the marks with GraphQL, falling back to REST for the
+    repositories GraphQL did not return
+    """
+    activities = {}
+    if GITHUB_GRAPHQL_ENABLED:
+        try:
+            activities = await stat_graphql.collect_repository_activities(
+                repo_fullnames, user_name, token, marks
+            )
+        except (BaseAppException, httpx.HTTPError) as e:
+            logger.warning(f"GraphQL activity collection failed, using REST: {e}")
+
+    missing_repo_fullnames = [
+        repo_fullname
+        for repo_fullname in repo_fullnames
+        if repo_fullname not in activities
+    ]
+    if missing_repo_fullnames:
+        activities.update(
+            await stat_service.collect_repository_activities(
+                missing_repo_fullnames, user_name, token, marks
+            )
+        )
+    return activities
+
+
+def merge_activity(user_activity: UserActivity, activity: dict):
+    """
+    Merge newly fetched activity into the snapshot and move its high-water mark
+    """
+    new_prs = activity["prs"]
+    new_pr_numbers = {pr["pull_request_number"] for pr in new_prs}
+    prs = new_prs + [
+        pr
+        for pr in user_activity.prs or []
+        if pr["pull_request_number"] not in new_pr_numbers
+    ]
+
+    # Commits are the whole history unless the fetch stopped at the mark.
+    # Commits a push webhook already added come again in the delta
+    commits = activity["commits"]
+    if activity["reached_commit_mark"]:
+        new_shas = {commit["sha"] for commit in commits}
+        commits = commits + [
+            commit
+            for commit in user_activity.commits or []
+            if commit["sha"] not in new_shas
+        ]
+
+    # Reassign (not mutate) JSON columns so the change is tracked
+    user_activity.prs = prs
+    user_activity.commits = commits
+    user_activity.last_merged_at = max(
+        (pr["merged_at"] for pr in prs), default=user_activity.last_merged_at
+    )
+    user_activity.last_commit_sha = activity["last_commit_sha"]
+    user_activity.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def collect_user_activities(
+    user_id: int, repo_fullnames: list[str], user_name, token, db: Session
+) -> dict[str, dict]:
+    """
+    Returns PRs and commits of every repository from the user's activity
+    snapshots, fetching only the activity newer than each snapshot's mark
+
+    Repositories that failed to fetch keep their stored snapshot, and are
+    left out only when there is none
+    """
+    snapshots = {
+        user_activity.repo_fullname: user_activity
+        for user_activity in await run_blocking(
+            user_activity_repository.find_all_user_activities_by_user_id, db, user_id
+        )
+    }
+    marks = {
+        repo_fullname: {
+            "last_merged_at": snapshots[repo_fullname].last_merged_at,
+            "last_commit_sha": snapshots[repo_fullname].last_commit_sha,
+        }
+        for repo_fullname in repo_fullnames
+        if repo_fullname in snapshots
+    }
+
+    activities = await fetch_activities(repo_fullnames, user_name, token, marks)
+
+    user_activities = []
+    for repo_fullname, activity in activities.items():
+        user_activity = snapshots.get(repo_fullname) or UserActivity(
+            user_id=user_id, repo_fullname=repo_fullname
+        )
+        merge_activity(user_activity, activity)
+        user_activities.append(user_activity)
+    await run_blocking(
+        user_activity_repository.save_user_activities, db, user_activities
+    )
+
+    failed_repo_fullnames = [
+        repo_fullname
+        for repo_fullname in repo_fullnames
+        if repo_fullname not in activities and repo_fullname in snapshots
+    ]
+    if failed_repo_fullnames:
+        logger.warning(
+            f"Using stored activity for repositories that failed to fetch: "
+            f"{failed_repo_fullnames}"
+        )
+    user_activities += [
+        snapshots[repo_fullname] for repo_fullname in failed_repo_fullnames
+    ]
+
+    return {
+        user_activity.repo_fullname: {
+            "prs": user_activity.prs,
+            "commits": [commit["message"] for commit in user_activity.commits or []],
+        }
+        for user_activity in user_activities
+    }
+
+
+def find_user_activities_by_github_names(
+    db: Session, repo_fullname: str, github_names: list[str]
+) -> dict[str, UserActivity]:
+    """
+    Returns the repository's activity snapshots keyed by GitHub name, for the
+    registered users who have one
+    """
+    users = find_all_users_by_github_names(db, github_names)
+    user_names = {user.id: user.github_name for user in users}
+    if not user_names:
+        return {}
+
+    return {
+        user_names[user_activity.user_id]: user_activity
+        for user_activity in user_activity_repository.find_all_user_activities_by_repo_fullname(
+            db, repo_fullname, list(user_names)
+        )
+    }
+
+
+def add_merged_pull_request(db: Session, repo_fullname: str, pull_request: dict):
+    """
+    Add a PR merged on GitHub (pull_request webhook) to its author's snapshot
+
+    Users without a snapshot are skipped, their first assessment reads the
+    whole history. The mark is not moved, so PRs whose webhook was missed are
+    still fetched, and the PR itself comes again as a duplicate of its number.
+    """
+    user_name = pull_request["user"]["login"]
+    user_activity = find_user_activities_by_github_names(
+        db, repo_fullname, [user_name]
+    ).get(user_name)
+    if not user_activity:
+        return
+
+    pr = stat_service.build_pull_request(
+        repo_fullname, pull_request, user_name, pull_request.get("body") or ""
+    )
+    user_activity.prs = [pr] + [
+        stored_pr
+        for stored_pr in user_activity.prs or []
+        if stored_pr["pull_request_number"] != pr["pull_request_number"]
+    ]
+    user_activity.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    user_activity_repository.save_user_activities(db, [user_activity])
+
+
+def add_pushed_commits(db: Session, repo_fullname: str, commits: list[dict]):
+    """
+    Add commits pushed to the default branch (push webhook, oldest first) to
+    their authors' snapshots
+
+    As with PRs, the mark is not moved: the next fetch reads the commits again
+    and merge_activity drops the copies by sha.
+    """
+    commits_by_author: dict[str, list[dict]] = {}
+    for commit in commits:
+        user_name = (commit.get("author") or {}).get("username")
+        if user_name:
+            commits_by_author.setdefault(user_name, []).append(
+                {"sha": commit["id"], "message": commit["message"]}
+            )
+
+    user_activities = find_user_activities_by_github_names(
+        db, repo_fullname, list(commits_by_author)
+    )
+    for user_name, user_activity in user_activities.items():
+        stored_commits = user_activity.commits or []
+        stored_shas = {commit["sha"] for commit in stored_commits}
+        new_commits = [
+            commit
+            for commit in reversed(commits_by_author[user_name])
+            if commit["sha"] not in stored_shas
+        ]
+        user_activity.commits = new_commits + stored_commits
+        user_activity.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    user_activity_repository.save_user_activities(db, list(user_activities.values()))
@@ -48,7 +48,9 @@ def get_all_selected_repositories(request: Request, db: Session = Depends(get_db
     summary="Get all repositories from GitHub",
     response_model=SuccessResponse[List[UserRepositoryRes]],
 )
-def get_all_repositories_from_github(request: Request, db: Session = Depends(get_db)):
+async def get_all_repositories_from_github(
+    request: Request, db: Session = Depends(get_db)
+):
     user_id = request.state.user_id
-    data = service.get_all_repositories_from_github(user_id, db)
+    data = await service.get_all_repositories_from_github(user_id, db)
     return user_repository_from_github_read_success(data)
@@ -2,6 +2,7 @@ from typing import List
 
 from sqlalchemy.orm import Session
 
+from src.common.util.executor import run_blocking
 from src.stat.service import get_repositories
 from src.user.repository import find_user_by_user_id
 from src.user_repository.schemas import UserRepositoryReq, UserRepositoryRes
@@ -35,7 +36,7 @@ def get_all_selected_repositories(user_id: int, db: Session):
     return selected_repository_list
 
 
-def get_all_repositories_from_github(user_id: int, db: Session):
-    user = find_user_by_user_id(db, user_id)
-    repo_list = get_repositories(user.github_access_token)
+async def get_all_repositories_from_github(user_id: int, db: Session):
+    user = await run_blocking(find_user_by_user_id, db, user_id)
+    repo_list = await get_repositories(user.github_access_token)
     return [UserRepositoryRes(repo_fullname=repo["name"]) for repo in repo_list]
@@ -0,0 +1,69 @@
+"""
+Replay recorded GitHub webhook deliveries against the webhook endpoint
+
+Each recording is a JSON file of the form
+    {"event": "issues", "payload": {...}}
+
+Usage:
+    python -m src.webhook.replay recordings/ --url http://localhost:8000
+
+In tests, pass FastAPI's TestClient (or any client with an httpx-like `post`)
+to `replay_deliveries`.
+"""
+
+import argparse
+import json
+import uuid
+from pathlib import Path
+
+import httpx
+
+from src.config.config import GITHUB_WEBHOOK_SECRET
+from src.webhook.service import sign_payload
+
+WEBHOOK_PATH = "/webhook/github"
+
+
+def load_deliveries(path: Path) -> list[dict]:
+    """
+    Load recordings from a file or every *.json file of a directory (sorted)
+    """
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    return [json.loads(file.read_text(encoding="utf-8")) for file in files]
+
+
+def replay_deliveries(client, deliveries: list[dict], secret: str) -> list:
+    """
+    Sign and post recorded deliveries in order
+
+    Returns the responses
+    """
+    responses = []
+    for delivery in deliveries:
+        body = json.dumps(delivery["payload"]).encode()
+        headers = {
+            "Content-Type": "application/json",
+            "X-GitHub-Event": delivery["event"],
+            "X-GitHub-Delivery": delivery.get("delivery", str(uuid.uuid4())),
+            "X-Hub-Signature-256": sign_payload(body, secret),
+        }
+        responses.append(client.post(WEBHOOK_PATH, content=body, headers=headers))
+    return responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay GitHub webhook recordings")
+    parser.add_argument("path", type=Path, help="Recording file or directory")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--secret", default=GITHUB_WEBHOOK_SECRET)
+    args = parser.parse_args()
+
+    with httpx.Client(base_url=args.url) as client:
+        responses = replay_deliveries(client, load_deliveries(args.path), args.secret)
+
+    for response in responses:
+        print(f"{response.status_code} {response.text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Header, Request
+
+from src.config.route_policy import RoutePolicy, register_route_policy
+from src.response.error_definitions import InvalidJsonFormat
+from src.response.schemas import SuccessResponse
+from src.response.success_definitions import webhook_receive_success
+from src.webhook import service
+
+router = APIRouter(prefix="/webhook", tags=["Webhook"])
+
+# GitHub deliveries are verified by their signature
+register_route_policy(f"{router.prefix}/github", RoutePolicy.PUBLIC)
+
+
+@router.post(
+    "/github",
+    summary="Receive GitHub webhook event",
+    response_model=SuccessResponse,
+)
+async def receive_github_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    x_github_event: str = Header(..., description="GitHub event name"),
+    x_hub_signature_256: str | None = Header(None, description="HMAC signature"),
+):
+    body = await request.body()
+    service.verify_signature(body, x_hub_signature_256)
+
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError:
+        raise InvalidJsonFormat()
+
+    background_tasks.add_task(service.handle_event, x_github_event, payload)
+    return webhook_receive_success()
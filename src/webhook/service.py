@@ -0,0 +1,122 @@
+import hashlib
+import hmac
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from src.config.config import GITHUB_WEBHOOK_SECRET
+from src.config.database import get_db
+from src.config.logger_config import add_daily_file_handler, setup_logger
+from src.issue.repository import to_project_issue
+from src.project_issue import repository as project_issue_repository
+from src.response.error_definitions import InvalidWebhookSignature
+from src.user_activity import service as user_activity_service
+
+REMOVED_ISSUE_ACTIONS = {"deleted", "transferred"}
+
+logger = setup_logger(__name__)
+add_daily_file_handler(logger)
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """
+    Returns X-Hub-Signature-256 header value of the payload
+    """
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(body: bytes, signature: str | None):
+    """
+    Verify HMAC signature GitHub sent with the webhook payload
+    """
+    if not GITHUB_WEBHOOK_SECRET or not signature:
+        raise InvalidWebhookSignature()
+
+    expected = sign_payload(body, GITHUB_WEBHOOK_SECRET)
+    if not hmac.compare_digest(expected, signature):
+        raise InvalidWebhookSignature()
+
+
+def apply_issues_event(db: Session, repo_fullname: str, payload: dict):
+    """
+    Reflect `issues` event to the local issue mirror
+    """
+    issue_json = payload["issue"]
+    if payload.get("action") in REMOVED_ISSUE_ACTIONS:
+        project_issue_repository.delete_project_issue(
+            db, repo_fullname, int(issue_json["number"])
+        )
+        return
+
+    project_issue_repository.upsert_project_issues(
+        db, repo_fullname, [to_project_issue(repo_fullname, issue_json)]
+    )
+
+
+def apply_issues_event_and_mark(db: Session, repo_fullname: str, payload: dict):
+    """
+    Apply `issues` event and mark the repository as webhook-fed
+    """
+    apply_issues_event(db, repo_fullname, payload)
+    project_issue_repository.save_project_issue_sync(
+        db,
+        repo_fullname,
+        webhook_received_at=datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+
+
+def apply_pull_request_event(db: Session, repo_fullname: str, payload: dict):
+    """
+    Reflect a merged PR to its author's activity snapshot
+    """
+    pull_request = payload["pull_request"]
+    if payload.get("action") != "closed" or not pull_request.get("merged"):
+        return
+    user_activity_service.add_merged_pull_request(db, repo_fullname, pull_request)
+
+
+def apply_push_event(db: Session, repo_fullname: str, payload: dict):
+    """
+    Reflect commits pushed to the default branch to the authors' activity
+    snapshots (the snapshots only hold default branch history)
+    """
+    default_branch = payload["repository"].get("default_branch")
+    if payload.get("deleted") or payload.get("ref") != f"refs/heads/{default_branch}":
+        return
+    user_activity_service.add_pushed_commits(
+        db, repo_fullname, payload.get("commits", [])
+    )
+
+
+# Only `issues` events mark the repository as webhook-fed, the others do not
+# prove the webhook sends `issues` events
+EVENT_HANDLERS = {
+    "issues": apply_issues_event_and_mark,
+    "pull_request": apply_pull_request_event,
+    "push": apply_push_event,
+}
+
+
+def handle_event(event: str, payload: dict):
+    """
+    Apply GitHub webhook event to the local state (runs as a background task)
+
+    `issues` events update the issue mirror, merged `pull_request` and `push`
+    events update the users' activity snapshots. Other events are ignored.
+    """
+    handler = EVENT_HANDLERS.get(event)
+    if handler is None:
+        return
+
+    repo_fullname = payload.get("repository", {}).get("full_name")
+    if not repo_fullname:
+        return
+
+    db = next(get_db())
+    try:
+        handler(db, repo_fullname, payload)
+    except Exception as e:
+        logger.error(f"Failed to apply GitHub webhook {event} ({repo_fullname}): {e}")
+    finally:
+        db.close()
@@ -0,0 +1,184 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "tests" / "fixtures" / "webhook"
+WEBHOOK_SECRET = "test-webhook-secret"
+REPO_FULLNAME = "coordipai/sample"
+
+# Configure before src.config is imported
+database_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///{database_dir}/webhook.db?check_same_thread=false"
+)
+os.environ["GITHUB_WEBHOOK_SECRET"] = WEBHOOK_SECRET
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import src.models  # noqa: E402, F401
+from src.config.database import Base, engine, session  # noqa: E402
+from src.models import (  # noqa: E402
+    ProjectIssue,
+    ProjectIssueSync,
+    User,
+    UserActivity,
+)
+from src.response.error_definitions import BaseAppException  # noqa: E402
+from src.response.handler import base_app_exception_handler  # noqa: E402
+from src.user_activity.service import merge_activity  # noqa: E402
+from src.webhook import service  # noqa: E402
+from src.webhook.replay import load_deliveries, replay_deliveries  # noqa: E402
+from src.webhook.router import router as webhook_router  # noqa: E402
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(BaseAppException, base_app_exception_handler)
+    app.include_router(webhook_router)
+    return app
+
+
+class WebhookReplayTest(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        self.client = TestClient(create_app())
+        self.secret_patch = mock.patch.object(
+            service, "GITHUB_WEBHOOK_SECRET", WEBHOOK_SECRET
+        )
+        self.secret_patch.start()
+        self.db = session()
+
+    def tearDown(self):
+        self.db.close()
+        self.secret_patch.stop()
+
+    def find_issues(self) -> dict[int, ProjectIssue]:
+        issues = self.db.query(ProjectIssue).filter(
+            ProjectIssue.repo_fullname == REPO_FULLNAME
+        )
+        return {issue.issue_number: issue for issue in issues}
+
+    def find_issue_sync(self) -> ProjectIssueSync | None:
+        return self.db.get(ProjectIssueSync, REPO_FULLNAME)
+
+    def create_user_activity(self, github_name: str) -> UserActivity:
+        user = User(name=github_name, github_name=github_name)
+        self.db.add(user)
+        self.db.commit()
+        user_activity = UserActivity(
+            user_id=user.id,
+            repo_fullname=REPO_FULLNAME,
+            prs=[],
+            commits=[{"sha": "abc100", "message": "Initial commit"}],
+            last_merged_at="2025-06-01T00:00:00Z",
+            last_commit_sha="abc100",
+        )
+        self.db.add(user_activity)
+        self.db.commit()
+        return user_activity
+
+    def test_replay_updates_issue_mirror(self):
+        responses = replay_deliveries(
+            self.client, load_deliveries(FIXTURES), WEBHOOK_SECRET
+        )
+
+        self.assertEqual([200] * len(responses), [r.status_code for r in responses])
+
+        issues = self.find_issues()
+        # 2 was deleted and 3 transferred to another repository
+        self.assertEqual([1], list(issues))
+        issue = issues[1]
+        self.assertEqual("Login page with OAuth", issue.title)
+        self.assertTrue(issue.closed)
+        self.assertEqual(["alice", "bob"], issue.assignees)
+        self.assertEqual(["FE"], issue.labels)
+        self.assertEqual(("H", 2), (issue.priority, issue.iteration))
+        self.assertIsNotNone(self.find_issue_sync().webhook_received_at)
+
+    def test_late_delivery_does_not_overwrite_newer_issue(self):
+        deliveries = [
+            *load_deliveries(FIXTURES / "01_issue_opened.json"),
+            *load_deliveries(FIXTURES / "04_issue_closed.json"),
+            # GitHub delivered the edit after the close
+            *load_deliveries(FIXTURES / "03_issue_edited.json"),
+        ]
+
+        responses = replay_deliveries(self.client, deliveries, WEBHOOK_SECRET)
+
+        self.assertEqual([200] * len(responses), [r.status_code for r in responses])
+        issue = self.find_issues()[1]
+        self.assertTrue(issue.closed)
+        self.assertEqual(datetime(2025, 6, 3), issue.updated_at)
+
+    def test_push_and_merged_pull_request_update_activity(self):
+        user_activity = self.create_user_activity("alice")
+        deliveries = [
+            *load_deliveries(FIXTURES / "08_push.json"),
+            *load_deliveries(FIXTURES / "09_pull_request_merged.json"),
+            # Redelivered
+            *load_deliveries(FIXTURES / "08_push.json"),
+            *load_deliveries(FIXTURES / "09_pull_request_merged.json"),
+        ]
+
+        responses = replay_deliveries(self.client, deliveries, WEBHOOK_SECRET)
+
+        self.assertEqual([200] * len(responses), [r.status_code for r in responses])
+        self.db.refresh(user_activity)
+        # carol has no snapshot, her commit is not stored anywhere
+        self.assertEqual(
+            ["abc123", "abc122", "abc100"],
+            [commit["sha"] for commit in user_activity.commits],
+        )
+        self.assertEqual([5], [pr["pull_request_number"] for pr in user_activity.prs])
+        self.assertEqual([1], user_activity.prs[0]["related_issues"])
+        # Marks are left for the next fetch
+        self.assertEqual("2025-06-01T00:00:00Z", user_activity.last_merged_at)
+        self.assertEqual("abc100", user_activity.last_commit_sha)
+
+        # The next fetch reads the pushed commits again
+        merge_activity(
+            user_activity,
+            {
+                "prs": [],
+                "commits": [
+                    {"sha": "abc125", "message": "Style login form"},
+                    {"sha": "abc123", "message": "Fix #1"},
+                    {"sha": "abc122", "message": "Add login form"},
+                ],
+                "reached_commit_mark": True,
+                "last_commit_sha": "abc125",
+            },
+        )
+        self.assertEqual(
+            ["abc125", "abc123", "abc122", "abc100"],
+            [commit["sha"] for commit in user_activity.commits],
+        )
+
+    def test_invalid_signature_is_rejected(self):
+        deliveries = load_deliveries(FIXTURES / "01_issue_opened.json")
+
+        responses = replay_deliveries(self.client, deliveries, "wrong-secret")
+
+        self.assertEqual(401, responses[0].status_code)
+        self.assertEqual({}, self.find_issues())
+        self.assertIsNone(self.find_issue_sync())
+
+    def test_push_does_not_mark_repository_as_webhook_fed(self):
+        deliveries = load_deliveries(FIXTURES / "08_push.json")
+
+        responses = replay_deliveries(self.client, deliveries, WEBHOOK_SECRET)
+
+        self.assertEqual(200, responses[0].status_code)
+        self.assertIsNone(self.find_issue_sync())
+
+
+if __name__ == "__main__":
+    unittest.main()